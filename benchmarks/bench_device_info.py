@@ -0,0 +1,124 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# Benchmark the device-info check parsing of the "show version" and "show
+# switch" output of an 8 slot stack.  The cached TTP parsers used by the check
+# executor are compared to creating a new TTP parser on every call, which
+# compiles the template each time.
+#
+#   python benchmarks/bench_device_info.py
+#   python benchmarks/bench_device_info.py --count 2000
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+import argparse
+import time
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+from ttp import ttp
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcam_aioexos.topology.exos_check_device_info import (
+    show_version_template,
+    show_switch_template,
+    ttp_parse,
+)
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+SLOTS = 8
+
+SHOW_VERSION = (
+    "".join(
+        f"Slot-{slot}    : 800745-00-06 1915N-4309{slot} Rev 6.0 "
+        "BootROM: 3.4.2.2    IMG: 31.7.1.4\n"
+        for slot in range(1, SLOTS + 1)
+    )
+    + "".join(
+        f"PSU-{slot}-1   : Internal PSU-1 800750-00-02 1914W-8012{slot}\n"
+        for slot in range(1, SLOTS + 1)
+    )
+    + "\n"
+    "Image   : ExtremeXOS version 31.7.1.4 by release-manager\n"
+    "          on Tue Jun 28 12:21:35 EDT 2022\n"
+    "Diagnostics : 5.12\n"
+    "Certified Version : EXOS Linux  4.14.138, FIPS fips-ecp-2.0.16\n"
+)
+
+SHOW_SWITCH = (
+    "SysName:          stack-sw1\n"
+    "SysLocation:\n"
+    "SysContact:       support@extremenetworks.com\n"
+    "System MAC:       00:04:96:00:00:01\n"
+    "System Type:      X465-48T-SwitchStack\n"
+    "\n"
+    "SysHealth check:  Enabled (Normal)\n"
+    "Recovery Mode:    All\n"
+    "System Watchdog:  Enabled\n"
+)
+
+
+def parse_new(data: str, template: str) -> list:
+    """parses using a new TTP parser; i.e. compiles the template"""
+    parser = ttp(data=data, template=template)
+    parser.parse()
+    return parser.result()
+
+
+def bench(parse, count: int) -> float:
+    """returns the average seconds to parse both outputs"""
+    started = time.perf_counter()
+    for _ in range(count):
+        parse(SHOW_VERSION, show_version_template)
+        parse(SHOW_SWITCH, show_switch_template)
+    return (time.perf_counter() - started) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark device-info parsing")
+    parser.add_argument("--count", type=int, default=500)
+    args = parser.parse_args()
+
+    # the results must be the same regardless of the parser used.
+
+    for data, template in (
+        (SHOW_VERSION, show_version_template),
+        (SHOW_SWITCH, show_switch_template),
+    ):
+        assert ttp_parse(data, template) == parse_new(data, template)
+
+    per_call = bench(parse_new, args.count)
+    cached = bench(ttp_parse, args.count)
+
+    print(f"{'new parser':<14} {per_call * 1e6:10.1f} us/device")
+    print(f"{'cached parser':<14} {cached * 1e6:10.1f} us/device")
+    print(f"{'speedup':<14} {per_call / cached:10.1f} x")
+
+
+if __name__ == "__main__":
+    main()
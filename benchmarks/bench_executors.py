@@ -0,0 +1,451 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# Benchmark the check executors against canned responses from synthetic large
+# devices.  The responses are produced by the simulator SimDevice and served
+# in-process, so no network is used.  For each executor and device size the
+# benchmark reports the wall time, CPU time, peak memory, and the number of
+# API requests and CLI commands.
+#
+#   python benchmarks/bench_executors.py
+#   python benchmarks/bench_executors.py --ports 384 --vlans 300 --repeat 5
+#
+# Each executor is given a synthetic check collection built from the simulated
+# device topology; a check per port, LAG, SVI, and VLAN as applicable to the
+# executor.  The benchmark therefore measures both the device data collection
+# and indexing, and the per-check evaluation; which is where the cost grows
+# with the device size.  Each run uses a new DUT so that the DUT cache is cold,
+# and a new check collection since the executors update the checks.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+from netcad.feats.topology.checks.check_device_info import (
+    DeviceInformationCheckCollection,
+)
+from netcad.feats.topology.checks.check_cabling_nei import (
+    InterfaceCablingCheckCollection,
+)
+from netcad.feats.topology.checks.check_transceivers import (
+    TransceiverCheckCollection,
+)
+from netcad.feats.topology.checks.check_ipaddrs import IPInterfacesCheckCollection
+from netcad.feats.topology.checks.check_interfaces import InterfaceCheckCollection
+from netcad.feats.topology.checks.check_lags import LagCheckCollection
+from netcad.feats.vlans.checks.check_vlans import VlanCheckCollection
+from netcad.feats.vlans.checks.check_switchports import SwitchportCheckCollection
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from netcam_aioexos.exos_plugin_init import exos_plugin_config
+from netcam_aioexos.exos_dut import EXOSDeviceUnderTest
+from netcam_aioexos.exos_if_roles import EXosInterfaceRoles
+from netcam_aioexos.simulator import SimDevice, SimDeviceSpec
+from netcam_aioexos.topology import (
+    exos_check_interfaces,
+    exos_check_ipaddrs,
+    exos_check_lags,
+    exos_check_transceivers,
+    exos_check_cabling,
+    exos_check_device_info,
+)
+from netcam_aioexos.vlans import exos_check_vlans, exos_check_switchports
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# port counts are built from 48 port slots: 48, 384 (8 slots), 1152 (24 slots)
+DEFAULT_PORTS = [48, 384, 1152]
+DEFAULT_VLANS = [10, 300, 4000]
+
+
+class CannedJsonRpc:
+    """
+    Stands in for the aio-exos JSON-RPC client; serves the SimDevice results
+    in the same form as the aio-exos `cli` method and counts the requests.  The
+    results are kept in the `canned` dictionary, shared by the DUTs of a
+    benchmark, so that the cost of generating them is not measured.
+    """
+
+    def __init__(self, sim_device: SimDevice, canned: dict):
+        self.sim_device = sim_device
+        self.canned = canned
+        self.requests = 0
+        self.commands = 0
+
+    def _result(self, command: str, text: bool):
+        if (result := self.canned.get((command, text))) is None:
+            if text:
+                result = self.sim_device.cli_text(command) or ""
+            else:
+                result = self.sim_device.cli(command) or []
+            self.canned[(command, text)] = result
+
+        return result
+
+    async def cli(self, commands, text=False):
+        self.requests += 1
+        cmd_list = [commands] if isinstance(commands, str) else commands
+        self.commands += len(cmd_list)
+
+        results = [self._result(command, text) for command in cmd_list]
+        if len(results) == 1:
+            return results if text else results[0]
+
+        return results
+
+    async def aclose(self):
+        pass
+
+
+def lag_name(group_id: int) -> str:
+    """the LAG interface name; see the DUT `get_lacp_snapshot` method"""
+    return f"lag{group_id}"
+
+
+def make_device(sim_device: SimDevice) -> SimpleNamespace:
+    """
+    Returns the device, with the design interfaces used by the check
+    executors, for the simulated device.
+    """
+    if_profile = SimpleNamespace(is_reserved=False)
+    return SimpleNamespace(
+        name=sim_device.name,
+        os_name="exos",
+        product_model="X465-48T",
+        interfaces={
+            if_name: SimpleNamespace(name=if_name, profile=if_profile)
+            for if_name in sim_device.ports
+        },
+    )
+
+
+def make_if_roles(sim_device: SimDevice) -> EXosInterfaceRoles:
+    """returns the design interface roles of the simulated device"""
+    svis = sim_device.vlan_ids[: sim_device.spec.svis]
+    lag_members = {
+        lag_name(group_id): members
+        for group_id, members in sim_device.lag_ports.items()
+    }
+    return EXosInterfaceRoles(
+        virtual={sim_device.vlan_name(vlan_id) for vlan_id in svis},
+        lags=set(lag_members),
+        lag_members=lag_members,
+    )
+
+
+def make_dut(
+    sim_device: SimDevice, canned: dict
+) -> tuple[EXOSDeviceUnderTest, CannedJsonRpc]:
+    dut = EXOSDeviceUnderTest(device=make_device(sim_device))
+    dut.exos_jrpc = CannedJsonRpc(sim_device, canned)
+    dut.device_info = dict(interfaces={})
+    dut.if_roles = make_if_roles(sim_device)
+    return dut, dut.exos_jrpc
+
+
+# -----------------------------------------------------------------------------
+# synthetic check collections, built from the simulated device topology
+# -----------------------------------------------------------------------------
+
+
+def vlan_profile(sim_device: SimDevice, vlan_id: int) -> dict:
+    return dict(vlan_id=vlan_id, name=sim_device.vlan_name(vlan_id))
+
+
+def device_info_checks(sim_device: SimDevice) -> list[dict]:
+    return [
+        dict(
+            check_params=dict(device=sim_device.name),
+            expected_results=dict(product_model="X465-48T"),
+        )
+    ]
+
+
+def interface_checks(sim_device: SimDevice) -> list[dict]:
+    """a check per port, LAG, and SVI; and the management port"""
+    svis = sim_device.vlan_ids[: sim_device.spec.svis]
+    if_names = [
+        *sim_device.ports,
+        *(lag_name(group_id) for group_id in sim_device.lag_ports),
+        *(sim_device.vlan_name(vlan_id) for vlan_id in svis),
+        "Mgmt",
+    ]
+    return [
+        dict(
+            check_params=dict(interface=if_name),
+            expected_results=dict(used=True, oper_up=True, desc="", speed=10_000),
+        )
+        for if_name in if_names
+    ]
+
+
+def ipaddr_checks(sim_device: SimDevice) -> list[dict]:
+    """a check per SVI; and the management port"""
+    svis = sim_device.vlan_ids[: sim_device.spec.svis]
+    return [
+        dict(
+            check_params=dict(if_name=sim_device.vlan_name(vlan_id)),
+            expected_results=dict(
+                if_ipaddr=f"10.{vlan_id // 256}.{vlan_id % 256}.1/24", oper_up=True
+            ),
+        )
+        for vlan_id in svis
+    ] + [
+        dict(
+            check_params=dict(if_name="Mgmt"),
+            expected_results=dict(if_ipaddr="192.168.1.10/24", oper_up=True),
+        )
+    ]
+
+
+def lag_checks(sim_device: SimDevice) -> list[dict]:
+    return [
+        dict(
+            check_params=dict(interface=lag_name(group_id)),
+            expected_results=dict(
+                enabled=True,
+                interfaces=[dict(enabled=True, interface=port) for port in members],
+            ),
+        )
+        for group_id, members in sim_device.lag_ports.items()
+    ]
+
+
+def transceiver_checks(sim_device: SimDevice) -> list[dict]:
+    return [
+        dict(
+            check_params=dict(if_name=port),
+            expected_results=dict(model="10GB-SR-SFPP", type="10GBASE-SR"),
+        )
+        for port in sim_device.ports
+    ]
+
+
+def cabling_checks(sim_device: SimDevice) -> list[dict]:
+    """a check per port; only the first ports have an LLDP neighbor"""
+    return [
+        dict(
+            check_params=dict(interface=port),
+            expected_results=dict(device=f"{sim_device.name}-nei{port_i}", port_id="1"),
+        )
+        for port_i, port in enumerate(sim_device.ports)
+    ]
+
+
+def vlan_checks(sim_device: SimDevice) -> list[dict]:
+    return [
+        dict(
+            check_params=dict(vlan_id=vlan_id),
+            expected_results=dict(
+                name=sim_device.vlan_name(vlan_id),
+                oper_up=True,
+                interfaces=[port for port, _ in sim_device.vlan_members(vlan_id)],
+            ),
+        )
+        for vlan_id in sim_device.vlan_ids
+    ]
+
+
+def switchport_checks(sim_device: SimDevice) -> list[dict]:
+    """an access check per port; and a trunk check per uplink port"""
+    trunk = dict(
+        switchport_mode="trunk",
+        native_vlan=None,
+        trunk_allowed_vlans=[
+            vlan_profile(sim_device, vlan_id) for vlan_id in sim_device.vlan_ids
+        ],
+    )
+    return [
+        dict(
+            check_params=dict(interface=port),
+            expected_results=(
+                dict(
+                    switchport_mode="access",
+                    vlan=vlan_profile(sim_device, sim_device.access_vlan[port]),
+                )
+                if port in sim_device.access_vlan
+                else trunk
+            ),
+        )
+        for port in sim_device.ports
+    ]
+
+
+EXECUTORS = {
+    "interfaces": (
+        exos_check_interfaces.exos_check_interfaces,
+        InterfaceCheckCollection,
+        interface_checks,
+    ),
+    "ipaddrs": (
+        exos_check_ipaddrs.exos_test_ipaddrs,
+        IPInterfacesCheckCollection,
+        ipaddr_checks,
+    ),
+    "lags": (exos_check_lags.exos_check_lags, LagCheckCollection, lag_checks),
+    "transceivers": (
+        exos_check_transceivers.exos_check_transceivers,
+        TransceiverCheckCollection,
+        transceiver_checks,
+    ),
+    "cabling": (
+        exos_check_cabling.exos_check_cabling,
+        InterfaceCablingCheckCollection,
+        cabling_checks,
+    ),
+    "device_info": (
+        exos_check_device_info.exos_check_device_info,
+        DeviceInformationCheckCollection,
+        device_info_checks,
+    ),
+    "vlans": (exos_check_vlans.eos_check_vlans, VlanCheckCollection, vlan_checks),
+    "switchports": (
+        exos_check_switchports.exos_check_switchports,
+        SwitchportCheckCollection,
+        switchport_checks,
+    ),
+}
+
+
+def make_collection(name: str, sim_device: SimDevice):
+    """returns a new check collection for the executor"""
+    _executor, c_type, make_checks = EXECUTORS[name]
+    return c_type.parse_obj(
+        dict(device=sim_device.name, exclusive=True, checks=make_checks(sim_device))
+    )
+
+
+async def bench_one(name: str, sim_device: SimDevice, repeat: int) -> dict:
+    """
+    Returns the best-of-repeat wall and CPU times for the executor.  The peak
+    memory is measured in a separate run since tracing the memory allocations
+    slows the execution.
+    """
+    executor = EXECUTORS[name][0]
+    best = None
+    canned = dict()
+
+    # warm-up run to generate the canned responses.
+    dut, _ = make_dut(sim_device, canned)
+    await executor(dut, make_collection(name, sim_device))
+
+    for _ in range(repeat):
+        dut, jrpc = make_dut(sim_device, canned)
+        collection = make_collection(name, sim_device)
+
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        results = await executor(dut, collection)
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+
+        if best is None or wall < best["wall"]:
+            best = dict(
+                wall=wall,
+                cpu=cpu,
+                checks=len(collection.checks),
+                results=len(results),
+                requests=jrpc.requests,
+                commands=jrpc.commands,
+            )
+
+    dut, _ = make_dut(sim_device, canned)
+    collection = make_collection(name, sim_device)
+    tracemalloc.start()
+    await executor(dut, collection)
+    _, best["peak_mem"] = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best
+
+
+def sim_spec(ports: int, vlans: int) -> SimDeviceSpec:
+    slots, ports_per_slot = (1, ports) if ports <= 48 else (ports // 48, 48)
+    svis = min(vlans, 20)
+    return SimDeviceSpec(
+        slots=slots,
+        ports_per_slot=ports_per_slot,
+        vlans=vlans,
+        svis=svis,
+        svis_down=svis // 2,
+        lags=4,
+        lag_members=2,
+        lldp_neighbors=min(ports, 48),
+    )
+
+
+async def run(args: argparse.Namespace):
+    print(
+        f"{'executor':<14}{'ports':>7}{'vlans':>7}{'checks':>8}{'results':>9}"
+        f"{'wall(ms)':>11}{'cpu(ms)':>10}{'peak(KiB)':>11}{'requests':>10}"
+        f"{'commands':>10}"
+    )
+
+    for ports in args.ports:
+        for vlans in args.vlans:
+            sim_device = SimDevice(name="bench-exos", spec=sim_spec(ports, vlans))
+
+            for name in args.executors:
+                msrd = await bench_one(name, sim_device, args.repeat)
+                print(
+                    f"{name:<14}{ports:>7}{vlans:>7}"
+                    f"{msrd['checks']:>8}{msrd['results']:>9}"
+                    f"{msrd['wall'] * 1e3:>11.2f}{msrd['cpu'] * 1e3:>10.2f}"
+                    f"{msrd['peak_mem'] / 1024:>11.1f}"
+                    f"{msrd['requests']:>10}{msrd['commands']:>10}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the EXOS check executors")
+    parser.add_argument("--ports", type=int, nargs="+", default=DEFAULT_PORTS)
+    parser.add_argument("--vlans", type=int, nargs="+", default=DEFAULT_VLANS)
+    parser.add_argument(
+        "--executors", nargs="+", choices=list(EXECUTORS), default=list(EXECUTORS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # the plugin configuration is required to create the DUT instances; the
+    # credentials are not used since no device is accessed.
+
+    os.environ.setdefault("BENCH_EXOS_USER", "bench")
+    os.environ.setdefault("BENCH_EXOS_PASSWD", "bench")
+    creds = dict(username="$BENCH_EXOS_USER", password="$BENCH_EXOS_PASSWD")
+    exos_plugin_config(dict(env=dict(read=creds, admin=creds)))
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
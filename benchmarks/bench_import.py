@@ -0,0 +1,125 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# Benchmark the import time of the plugin feature packages, as imported by
+# netcam, with the lazy check executor registration ("lazy"); compared to also
+# importing all of the check executor modules ("eager"), as is done on the
+# first dispatch of each check collection.  Each import is run in a new Python
+# process so that nothing is already imported.
+#
+#   python benchmarks/bench_import.py
+#   python benchmarks/bench_import.py --repeat 20 --top 15
+#
+# The --top option reports the slowest modules, by cumulative import time, of
+# the eager import using the Python "-X importtime" option.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+FEATURE_PACKAGES = ["netcam_aioexos", "netcam_aioexos.topology", "netcam_aioexos.vlans"]
+
+CHECK_MODULES = [
+    "netcam_aioexos.topology.exos_check_device_info",
+    "netcam_aioexos.topology.exos_check_cabling",
+    "netcam_aioexos.topology.exos_check_transceivers",
+    "netcam_aioexos.topology.exos_check_ipaddrs",
+    "netcam_aioexos.topology.exos_check_interfaces",
+    "netcam_aioexos.topology.exos_check_lags",
+    "netcam_aioexos.vlans.exos_check_vlans",
+    "netcam_aioexos.vlans.exos_check_switchports",
+]
+
+IMPORTS = {
+    "lazy": FEATURE_PACKAGES,
+    "eager": FEATURE_PACKAGES + CHECK_MODULES,
+}
+
+
+def import_stmt(modules: list[str]) -> str:
+    return "; ".join(f"import {module}" for module in modules)
+
+
+def time_import(modules: list[str]) -> float:
+    """returns the wall time, in seconds, of a new process importing the modules"""
+    started = time.perf_counter()
+    subprocess.run([sys.executable, "-c", import_stmt(modules)], check=True)
+    return time.perf_counter() - started
+
+
+def slowest_imports(modules: list[str], top: int) -> list[tuple[int, str]]:
+    """
+    Returns the (cumulative microseconds, module) of the slowest imports as
+    reported by the Python "-X importtime" option.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", import_stmt(modules)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    # each line is: "import time: self [us] | cumulative | imported package"
+
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _self_us, cumulative_us, module = line.split(":", 1)[1].split("|")
+        timings.append((int(cumulative_us), module.strip()))
+
+    return sorted(timings, reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the plugin import time")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=0)
+    args = parser.parse_args()
+
+    # the interpreter startup time is reported so that it can be discounted
+    # from the import times.
+
+    startup = statistics.median(time_import([]) for _ in range(args.repeat))
+    print(f"{'startup':<8} median {startup * 1000:8.1f} ms")
+
+    for name, modules in IMPORTS.items():
+        times = [time_import(modules) for _ in range(args.repeat)]
+        print(
+            f"{name:<8} median {statistics.median(times) * 1000:8.1f} ms"
+            f"  min {min(times) * 1000:8.1f} ms"
+        )
+
+    if args.top:
+        print("\nslowest eager imports (cumulative):")
+        for cumulative_us, module in slowest_imports(IMPORTS["eager"], args.top):
+            print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,7 @@ from . import exos_dut
 from .exos_get_dut import plugin_get_dut
 from .exos_get_dcfg import plugin_get_dcfg
 from .exos_plugin_init import plugin_init
+from .exos_prescan import plugin_prescan
 
 
 plugin_version = importlib_metadata.version(__name__)
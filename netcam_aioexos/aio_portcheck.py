@@ -2,7 +2,8 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Optional
+from typing import Optional, Iterable
+from time import monotonic
 import socket
 import asyncio
 
@@ -17,7 +18,21 @@ from httpx import URL
 # Exports
 # -----------------------------------------------------------------------------
 
-__all__ = ["port_check_url"]
+__all__ = ["port_check_url", "port_check_urls"]
+
+# -----------------------------------------------------------------------------
+# Globals
+# -----------------------------------------------------------------------------
+
+# the number of seconds a resolved host address is kept in the DNS cache.
+DNS_CACHE_TTL = 300
+
+# the cache of URL scheme to service port number, for example "https" -> 443.
+_service_ports: dict[str, int] = dict()
+
+# the shared DNS cache; host -> (expires, future-of-address).  The future is
+# shared so that concurrent checks for the same host resolve it once.
+_dns_cache: dict[str, tuple[float, asyncio.Future]] = dict()
 
 # -----------------------------------------------------------------------------
 #
@@ -40,12 +55,14 @@ async def port_check_url(url: URL, timeout: Optional[int] = 5) -> bool:
     timeout: optional, default is 5 seonds
         Time to await for the port to open in seconds
     """
-    port = url.port or socket.getservbyname(url.scheme)
+    port = url.port or await _resolve_service_port(url.scheme)
 
     try:
+        host_addr = await asyncio.wait_for(_resolve_host(url.host), timeout=timeout)
+
         wr: asyncio.StreamWriter
         _, wr = await asyncio.wait_for(
-            asyncio.open_connection(host=url.host, port=port), timeout=timeout
+            asyncio.open_connection(host=host_addr, port=port), timeout=timeout
         )
 
         # MUST close if opened!
@@ -54,3 +71,88 @@ async def port_check_url(url: URL, timeout: Optional[int] = 5) -> bool:
 
     except Exception:  # noqa
         return False
+
+
+async def port_check_urls(
+    urls: Iterable[URL], concurrency: Optional[int] = 100, timeout: Optional[int] = 5
+) -> dict[URL, bool]:
+    """
+    This function checks the ports designated by the URLs concurrently, with
+    at most `concurrency` checks in progress at any one time.
+
+    Parameters
+    ----------
+    urls:
+        The URLs that provide the target systems
+
+    concurrency: optional, default is 100
+        The maximum number of port checks in progress at one time
+
+    timeout: optional, default is 5 seconds
+        Time to await for each port to open in seconds
+
+    Returns
+    -------
+    The mapping of each URL to True if the port is available; False
+    otherwise.
+    """
+    urls = list(urls)
+    sema = asyncio.Semaphore(max(concurrency, 1))
+
+    async def check_url(url: URL) -> bool:
+        async with sema:
+            return await port_check_url(url, timeout=timeout)
+
+    url_ok = await asyncio.gather(*(check_url(url) for url in urls))
+    return dict(zip(urls, url_ok))
+
+
+# -----------------------------------------------------------------------------
+#
+#                            PRIVATE CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+async def _resolve_service_port(scheme: str) -> int:
+    """
+    Returns the service port number for the URL scheme.  The lookup is
+    memoized and is run in a worker thread since the underlying libc call
+    blocks.
+    """
+    if (port := _service_ports.get(scheme)) is None:
+        port = await asyncio.to_thread(socket.getservbyname, scheme)
+        _service_ports[scheme] = port
+
+    return port
+
+
+async def _resolve_host(host: str) -> str:
+    """
+    Returns the address of the host using the event loop resolver, which does
+    not block the loop.  The result is kept in the shared DNS cache for
+    DNS_CACHE_TTL seconds; failed lookups are not cached.
+    """
+    loop = asyncio.get_running_loop()
+    now = monotonic()
+
+    cached = _dns_cache.get(host)
+    if not cached or cached[0] < now or cached[1].get_loop() is not loop:
+        fut = asyncio.ensure_future(
+            loop.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        )
+
+        def on_done(_fut: asyncio.Future):
+            if _fut.cancelled() or _fut.exception():
+                if (entry := _dns_cache.get(host)) and entry[1] is _fut:
+                    del _dns_cache[host]
+
+        fut.add_done_callback(on_done)
+        cached = _dns_cache[host] = (now + DNS_CACHE_TTL, fut)
+
+    addr_info = await asyncio.shield(cached[1])
+
+    # the address info is a list of (family, type, proto, canonname, sockaddr)
+    # tuples; the host address is the first item of the sockaddr.
+
+    return addr_info[0][4][0]
@@ -0,0 +1,110 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+import asyncio
+from time import monotonic
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EXosApiBudget"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class EXosApiBudget:
+    """
+    The EXosApiBudget is the process-wide concurrency budget for EXOS API
+    requests.  Every DUT acquires from the same budget, via `async with`, so
+    that the total number of concurrent requests across all devices is
+    bounded.  The budget keeps counters so that the User can size the limit;
+    see the `stats` method.
+
+    Attributes
+    ----------
+    limit: int
+        The maximum number of concurrent API requests.
+
+    waiting: int
+        The number of requests currently queued for the budget.
+
+    inflight: int
+        The number of requests currently holding the budget.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(limit, 1)
+        self._sema = asyncio.Semaphore(self.limit)
+
+        self.waiting = 0
+        self.inflight = 0
+
+        self.max_waiting = 0
+        self.max_inflight = 0
+        self.total_acquired = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    async def __aenter__(self):
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        wait_start = monotonic()
+
+        try:
+            await self._sema.acquire()
+        finally:
+            self.waiting -= 1
+
+        wait_time = monotonic() - wait_start
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        self.total_acquired += 1
+
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.inflight -= 1
+        self._sema.release()
+
+    def stats(self) -> dict:
+        """
+        Returns the budget counters as a dictionary.  The wait time values are
+        in seconds.
+        """
+        return dict(
+            limit=self.limit,
+            waiting=self.waiting,
+            inflight=self.inflight,
+            max_waiting=self.max_waiting,
+            max_inflight=self.max_inflight,
+            total_acquired=self.total_acquired,
+            total_wait_time=self.total_wait_time,
+            max_wait_time=self.max_wait_time,
+            avg_wait_time=(
+                self.total_wait_time / self.total_acquired
+                if self.total_acquired
+                else 0.0
+            ),
+        )
@@ -0,0 +1,107 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Any
+from pathlib import Path
+import gzip
+import json
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EXosCaptureArchive", "capture_key"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def capture_key(command: str, text: bool = False) -> str:
+    """
+    Returns the archive key for a CLI command.  The output format is part of
+    the key since the same command may be used for both text and dict
+    results.
+    """
+    return f"{'text' if text else 'json'}:{command}"
+
+
+class EXosCaptureArchive:
+    """
+    The EXosCaptureArchive stores the API responses of one device in a
+    compressed archive file.  In "record" mode the DUT stores every response
+    and the archive is saved when the DUT is torn down.  In "replay" mode the
+    archive is loaded when the DUT is created, and the DUT serves the
+    responses from the archive rather than the device.
+
+    The archive is a gzip-compressed JSON file, named "<device>.json.gz", in
+    the capture directory.  Each response is stored as if the command was
+    executed on its own, so an archive recorded using batched requests can be
+    replayed with any batch size.
+
+    Attributes
+    ----------
+    device_name: str
+        The name of the device.
+
+    path: Path
+        The archive file path.
+
+    responses: dict
+        The mapping of archive key, see `capture_key`, to response.
+    """
+
+    def __init__(self, capture_dir: Path, device_name: str):
+        self.device_name = device_name
+        self.path = Path(capture_dir).expanduser() / f"{device_name}.json.gz"
+        self.responses: dict[str, Any] = dict()
+
+    def load(self):
+        """Loads the archive file; raises RuntimeError if it does not exist."""
+        try:
+            with gzip.open(self.path, "rt") as ifile:
+                self.responses = json.load(ifile)["responses"]
+        except FileNotFoundError:
+            raise RuntimeError(
+                f"Missing EXOS capture archive for device {self.device_name}: "
+                f"{self.path}"
+            )
+
+    def save(self):
+        """Saves the archive file, creating the capture directory if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wt") as ofile:
+            json.dump(dict(device=self.device_name, responses=self.responses), ofile)
+
+    def get(self, key: str) -> Any:
+        """
+        Returns the response for the archive key; raises RuntimeError if the
+        response was not captured.
+        """
+        try:
+            return self.responses[key]
+        except KeyError:
+            raise RuntimeError(
+                f"No captured response for '{key}' on EXOS device {self.device_name}"
+            )
+
+    def put(self, key: str, response: Any):
+        """Stores the response for the archive key."""
+        self.responses[key] = response
@@ -23,8 +23,12 @@
 # -----------------------------------------------------------------------------
 
 import asyncio
-from typing import Optional
-from functools import singledispatchmethod
+import importlib
+from time import monotonic
+from typing import Optional, Sequence, Iterable, Callable, Awaitable, Any
+from contextlib import nullcontext
+from itertools import chain
+from functools import singledispatchmethod, partial
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -43,7 +47,16 @@ from netcam.dut import AsyncDeviceUnderTest, SetupError
 # -----------------------------------------------------------------------------
 
 from .exos_plugin_globals import g_exos
-from .aio_portcheck import port_check_url
+from .exos_if_roles import EXosInterfaceRoles
+from .exos_capture import EXosCaptureArchive, capture_key
+from .exos_instrument import EXosCommandStats
+from .exos_retry import EXosCircuitBreaker, retry_delay
+from .exos_system_info import (
+    OC_PLATFORM_COMPONENTS,
+    system_info_from_cli,
+    system_info_from_openconfig,
+)
+from .exos_prescan import prescan_device
 
 
 # -----------------------------------------------------------------------------
@@ -66,30 +79,106 @@ class EXOSDeviceUnderTest(AsyncDeviceUnderTest):
     communicating with the device via the JSONRPC interface.  The underpinning
     transport is using asyncio.  Refer to the `aioexos` distribution for
     further details.
+
+    Attributes
+    ----------
+    prefetch_plan: dict[type, tuple[str]]
+        The check collection type to DUT accessor method names map; i.e. the
+        data each check executor uses.  The check executor modules declare
+        their entries using the `prefetch_register` method.
     """
 
+    prefetch_plan: dict[type[CheckCollection], tuple[str, ...]] = dict()
+
     def __init__(self, *, device: Device, **_kwargs):
         """DUT construction creates instance of EXOS API transport"""
 
         super().__init__(device=device)
 
+        # the API clients use the transport shared by all DUTs so that there
+        # is one connection pool for the process.  The connect timeout is
+        # kept short so that an offline device fails fast.  The client timeout
+        # is the largest command timeout; the timeout of each request is
+        # applied by the `cli` and `restconf_get` methods.
+
+        api_timeout = httpx.Timeout(
+            g_exos.timeouts.max_timeout, connect=g_exos.config.connect_timeout
+        )
+
+        api_host = g_exos.device_host(device.name)
+
         self.exos_jrpc = DeviceExosJsonRpc(
-            host=device.name, auth=g_exos.basic_auth, timeout=g_exos.config.timeout
+            host=api_host,
+            proto=g_exos.config.proto,
+            auth=g_exos.basic_auth,
+            timeout=api_timeout,
+            transport=g_exos.transport,
         )
         self.exos_restc = DeviceExosRestConf(
-            host=device.name,
+            host=api_host,
+            proto=g_exos.config.proto,
             username=g_exos.scp_creds[0],
             password=g_exos.scp_creds[1],
-            timeout=g_exos.config.timeout,
+            timeout=api_timeout,
+            transport=g_exos.transport,
         )
 
         self.system_info: Optional[dict] = None
 
+        # the design interface roles index; built during setup.
+        self.if_roles: Optional[EXosInterfaceRoles] = None
+
+        # when the plugin is configured to record or replay the API responses,
+        # set up the device capture archive.  In replay mode, the archive is
+        # loaded now so that a missing archive is found before any checks.
+
+        self._capture: Optional[EXosCaptureArchive] = None
+
+        if g_exos.config.capture_mode:
+            self._capture = EXosCaptureArchive(
+                capture_dir=g_exos.config.capture_dir, device_name=device.name
+            )
+            if g_exos.config.capture_mode == "replay":
+                self._capture.load()
+
         # inialize the DUT cache mechanism; used exclusvely by the
-        # `api_cache_get` method.
+        # `api_cache_get` method.  Each cache entry is the future of the
+        # command that produces the data, so that concurrent callers for the
+        # same key share a single in-flight request.
+
+        self._api_cache: dict[str, asyncio.Future] = dict()
+
+        # limit the number of concurrent API requests sent to the device so
+        # that check-executor fan-out does not overwhelm the device
+        # management CPU.
+
+        self._api_inflight = asyncio.Semaphore(
+            max(g_exos.config.max_inflight_per_device, 1)
+        )
 
-        self._api_cache_lock = asyncio.Lock()
-        self._api_cache = dict()
+        # when instrumentation is enabled, collect the per-command measurements
+        # and pass them to the instrumentation hooks.
+
+        self.api_stats: Optional[EXosCommandStats] = None
+
+        if g_exos.config.instrument or g_exos.instrument_hooks:
+            self.api_stats = EXosCommandStats(
+                device=device.name, hooks=g_exos.instrument_hooks
+            )
+
+        # the device circuit breaker; opened after consecutive API request
+        # timeouts so that the remaining requests fail immediately.
+
+        self._api_breaker = EXosCircuitBreaker(
+            device_name=device.name, threshold=g_exos.config.breaker_threshold
+        )
+
+        # the background tasks started by the `prefetch` method.
+
+        self._prefetch_tasks: set[asyncio.Task] = set()
+
+        # set while the DUT holds the shared transport; see `_setup`.
+        self._transport_acquired = False
 
     # -------------------------------------------------------------------------
     #
@@ -97,6 +186,102 @@ class EXOSDeviceUnderTest(AsyncDeviceUnderTest):
     #
     # -------------------------------------------------------------------------
 
+    @classmethod
+    def prefetch_register(cls, collection_type: type[CheckCollection], *accessors: str):
+        """
+        Declares the DUT accessor methods used by the check executor of the
+        given check collection type.
+
+        Parameters
+        ----------
+        collection_type: type[CheckCollection]
+            The check collection type.
+
+        accessors: str
+            The names of the DUT accessor methods, each called with no
+            arguments; for example "get_vlans".
+        """
+        cls.prefetch_plan[collection_type] = accessors
+
+    @classmethod
+    def register_lazy(
+        cls, collection_type: type[CheckCollection], module_name: str, executor: str
+    ):
+        """
+        Registers an import-time stub check executor for the check collection
+        type.  The stub imports the check executor module, and its
+        dependencies, on first dispatch.  Importing the module registers the
+        real check executor in place of the stub, and the stub passes the
+        first dispatch to it.
+
+        Parameters
+        ----------
+        collection_type: type[CheckCollection]
+            The check collection type.
+
+        module_name: str
+            The absolute name of the check executor module.
+
+        executor: str
+            The name of the check executor function in the module.
+        """
+
+        async def lazy_executor(self, collection):
+            module = importlib.import_module(module_name)
+            return await getattr(module, executor)(self, collection)
+
+        cls.execute_checks.register(collection_type, lazy_executor)
+
+    def prefetch_accessors(
+        self, collection_types: Iterable[type[CheckCollection]]
+    ) -> list[str]:
+        """
+        Returns the union of the DUT accessor method names needed by the given
+        check collection types, in plan order.
+        """
+        return list(
+            dict.fromkeys(
+                chain.from_iterable(
+                    self.prefetch_plan.get(c_type, ()) for c_type in collection_types
+                )
+            )
+        )
+
+    def design_collection_types(self) -> list[type[CheckCollection]]:
+        """
+        Returns the check collection types of the device design services; i.e.
+        the check collections that netcam dispatches to the DUT.
+        """
+        return list(
+            dict.fromkeys(
+                chain.from_iterable(
+                    service.check_collections for service in self.device.services
+                )
+            )
+        )
+
+    def prefetch(self, collection_types: Iterable[type[CheckCollection]]):
+        """
+        Starts, in the background, the API requests needed by the check
+        executors of the given check collection types.  The accessor results
+        are cached, so each check executor consumes the result that is either
+        already resolved or in-flight; i.e. the per-device latency is roughly
+        the slowest request rather than the sum of the requests.
+
+        A prefetch failure is not reported here; the check executor calling
+        the accessor retries the request and handles the error.
+        """
+        for accessor in self.prefetch_accessors(collection_types):
+            task = asyncio.create_task(getattr(self, accessor)())
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_done)
+
+    def _prefetch_done(self, task: asyncio.Task):
+        """retrieves the task result so that a failure is not logged"""
+        self._prefetch_tasks.discard(task)
+        if not task.cancelled():
+            task.exception()
+
     async def api_cache_get(self, key: str, command: str, **kwargs) -> dict | str:
         """
         This function is used by other class methods that want to abstract the
@@ -126,18 +311,738 @@ class EXOSDeviceUnderTest(AsyncDeviceUnderTest):
         example `ofmt` can be used to change the output format from the default
         of dict to text.  Refer to the aio-exos package for further details.
 
+        Notes
+        -----
+        The cache is "single-flight" per key.  The first caller for a given key
+        starts the command, and any concurrent callers for the same key await
+        that same in-flight request.  Callers using different keys are not
+        blocked by one another.  If the command fails, the key is removed from
+        the cache so that a later caller may retry.
+
         Returns
         -------
         Either the cached data corresponding to the key if exists in the cache,
         or the newly retrieved data from the device; which is then cached for
         future use.
         """
-        async with self._api_cache_lock:
-            if not (has_data := self._api_cache.get(key)):
-                has_data = await self.exos_jrpc.cli(command, **kwargs)
-                self._api_cache[key] = has_data
+        cache_hit = key in self._api_cache
+        started = monotonic()
+
+        result = await self.api_cache_call(key, partial(self.cli, command, **kwargs))
+
+        if cache_hit and self.api_stats:
+            self.api_stats.record(command, monotonic() - started, cache_hit=True)
+
+        return result
+
+    async def api_cache_call(self, key: str, func: Callable[[], Awaitable]) -> Any:
+        """
+        This function provides the same single-flight caching as
+        `api_cache_get`, but for any coroutine function rather than a single
+        CLI command.  This is used by the DUT methods that derive data from
+        multiple commands; for example the VLAN membership index.
+
+        Parameters
+        ----------
+        key: str
+            The cache-key string that is used to uniquely identify the contents
+            of the cache.
+
+        func: Callable
+            The coroutine function, called with no arguments, that produces the
+            data to cache.
+
+        Returns
+        -------
+        The cached data corresponding to the key.
+        """
+        if not (fut := self._api_cache.get(key)):
+            fut = asyncio.ensure_future(func())
+            fut.add_done_callback(partial(self._api_cache_done, key))
+            self._api_cache[key] = fut
+
+        # shield the shared future so that a cancelled caller does not cancel
+        # the request for the other callers awaiting the same key.
+
+        return await asyncio.shield(fut)
+
+    async def cli(self, commands: str | list[str], text: Optional[bool] = False):
+        """
+        This function executes the CLI command(s) on the device via the
+        JSON-RPC API.  All DUT API requests MUST use this method so that the
+        number of concurrent requests to the device is bounded by the
+        `max_inflight_per_device` plugin config, and the total number of
+        concurrent requests across all devices is bounded by the process-wide
+        API budget.
+
+        A request that fails with a transport error, other than a timeout, or
+        with one of the `retry_status_codes` plugin config HTTP status codes,
+        is retried up to the `retries` plugin config.  Once the device has timed
+        out `breaker_threshold` consecutive times, the device circuit breaker
+        is opened and the remaining requests fail immediately.
+
+        Parameters
+        ----------
+        commands: str | list[str]
+            The CLI command, or list of commands, as supported by the aio-exos
+            `cli` method.
+
+        text: bool, optional
+            When True the results are the CLI text output, otherwise the
+            results are the dict payloads.
+
+        Returns
+        -------
+        The command results as returned by the aio-exos `cli` method.
+
+        Raises
+        ------
+        EXosCircuitOpenError
+            When the device circuit breaker is open.
+        """
+        if self._capture and g_exos.config.capture_mode == "replay":
+            started = monotonic()
+            with self._cli_span(commands, text):
+                rsp = self._capture_replay(commands, text=text)
+            self._instrument(commands, text, monotonic() - started, rsp=rsp)
+            return rsp
+
+        rsp, latency, retries = await self._api_retry(
+            partial(self._cli_request, commands, text)
+        )
+
+        if self._capture:
+            self._capture_record(commands, text=text, rsp=rsp)
+
+        self._instrument(commands, text, latency, rsp=rsp, retries=retries)
+        return rsp
+
+    async def _api_retry(
+        self, request: Callable[[], Awaitable[tuple[Any, float]]]
+    ) -> tuple[Any, float, int]:
+        """
+        Calls the API request function, which returns the tuple of response
+        and latency, with the DUT retry and circuit breaker policy.  Returns
+        the tuple of response, latency, and the number of retries.
+
+        A request that fails with a transport error, for example a dropped
+        connection, or with one of the `retry_status_codes` plugin config HTTP
+        status codes, for example 503, is retried after a jittered backoff, up
+        to the `retries` plugin config.  A request timeout is not retried,
+        since a retry would wait for the full timeout again; the timeout is
+        counted by the device circuit breaker instead.
+        """
+        config = g_exos.config
+        attempt = 0
+
+        while True:
+            self._api_breaker.check()
+
+            try:
+                rsp, latency = await request()
+                break
+
+            except httpx.TimeoutException as exc:
+                self._api_breaker.failure(exc)
+                raise
+
+            except httpx.TransportError:
+                if attempt >= config.retries:
+                    raise
+
+            except httpx.HTTPStatusError as exc:
+                if (
+                    exc.response.status_code not in config.retry_status_codes
+                    or attempt >= config.retries
+                ):
+                    raise
+
+            attempt += 1
+            await asyncio.sleep(
+                retry_delay(attempt, config.retry_backoff, config.retry_backoff_max)
+            )
+
+        self._api_breaker.success()
+        return rsp, latency, attempt
+
+    async def _cli_request(
+        self, commands: str | list[str], text: bool
+    ) -> tuple[list, float]:
+        """
+        Sends the JSON-RPC CLI request to the device, and returns the tuple of
+        the response and the request latency.
+        """
+
+        # acquire the per-device limit before the process-wide budget so that
+        # requests queued for a busy device do not hold the global budget.  The
+        # latency is measured once the request is sent; i.e. it does not
+        # include the time waiting for the limits.
+
+        # the request timeout is determined by the commands, see the
+        # `timeouts` and `adaptive_timeouts` plugin config.  The request
+        # timeout is raised as the httpx read timeout so that it is handled the
+        # same as the client timeout.  Any timeout discards the learned latency
+        # of the commands.
+
+        cmd_list = [commands] if isinstance(commands, str) else commands
+        model = self.device.product_model
+        timeout = g_exos.timeouts.timeout(model, cmd_list)
+
+        async with self._api_inflight, g_exos.api_budget:
+            started = monotonic()
+            try:
+                with self._cli_span(commands, text):
+                    try:
+                        rsp = await asyncio.wait_for(
+                            self.exos_jrpc.cli(commands, text=text), timeout
+                        )
+                    except asyncio.TimeoutError as exc:
+                        raise httpx.ReadTimeout(
+                            f"EXOS device {self.device.name}: request timeout "
+                            f"after {timeout}s: {cmd_list[0]}"
+                        ) from exc
+
+            except Exception as exc:
+                if isinstance(exc, httpx.TimeoutException):
+                    g_exos.timeouts.learn_timeout(model, cmd_list)
+                self._instrument(commands, text, monotonic() - started, error=exc)
+                raise
+
+            latency = monotonic() - started
+
+        g_exos.timeouts.learn(model, cmd_list, latency)
+        return rsp, latency
+
+    def trace_span(self, name: str, **attributes):
+        """
+        Returns the context manager for a tracing span, with the device name
+        attribute, when tracing is enabled by the plugin config.  Otherwise a
+        no-op context manager is returned.
+        """
+        if not (tracer := g_exos.tracer):
+            return nullcontext()
+
+        return tracer.span(name, device=self.device.name, **attributes)
+
+    def _cli_span(self, commands: str | list[str], text: bool):
+        """returns the tracing span for a CLI request"""
+        cmd_list = [commands] if isinstance(commands, str) else commands
+        return self.trace_span(
+            "cli", command="; ".join(cmd_list), commands=len(cmd_list), text=text
+        )
+
+    @staticmethod
+    def _cli_split(commands: str | list[str], text: bool, rsp: list) -> list:
+        """
+        Splits the response of the aio-exos `cli` method into a list of
+        (command, result) tuples; where each result is in the form as if the
+        command was executed on its own.
+        """
+        cmd_list = [commands] if isinstance(commands, str) else commands
+
+        if len(cmd_list) == 1:
+            return [(cmd_list[0], rsp)]
+
+        return [
+            (command, [cmd_rsp] if text else cmd_rsp)
+            for command, cmd_rsp in zip(cmd_list, rsp)
+        ]
+
+    def _capture_record(self, commands: str | list[str], text: bool, rsp: list):
+        """
+        Stores the command response(s) in the capture archive.  The response of
+        a batched request is split so each command is stored as if it was
+        executed on its own.
+        """
+        for command, cmd_rsp in self._cli_split(commands, text, rsp):
+            self._capture.put(capture_key(command, text), cmd_rsp)
+
+    def _instrument(
+        self,
+        commands: str | list[str],
+        text: bool,
+        latency: float,
+        rsp: Optional[list] = None,
+        error: Optional[Exception] = None,
+        retries: int = 0,
+    ):
+        """
+        Records the command event(s) when instrumentation is enabled.  Each
+        command of a batched request is recorded with the request latency.
+        """
+        if not (api_stats := self.api_stats):
+            return
+
+        if error is not None:
+            cmd_list = [commands] if isinstance(commands, str) else commands
+            for command in cmd_list:
+                api_stats.record(command, latency, error=repr(error))
+            return
+
+        for command, cmd_rsp in self._cli_split(commands, text, rsp):
+            cmd_result = cmd_rsp[0] if text else cmd_rsp
+            rsp_bytes, rsp_records = api_stats.result_size(cmd_result)
+            api_stats.record(
+                command,
+                latency,
+                response_bytes=rsp_bytes,
+                records=rsp_records,
+                retries=retries,
+            )
+
+    def _capture_replay(self, commands: str | list[str], text: bool) -> list:
+        """
+        Returns the command response(s) from the capture archive in the same
+        form as the aio-exos `cli` method.
+        """
+        cmd_list = [commands] if isinstance(commands, str) else commands
+
+        if len(cmd_list) == 1:
+            return self._capture.get(capture_key(cmd_list[0], text))
+
+        cmd_rsps = [
+            self._capture.get(capture_key(command, text)) for command in cmd_list
+        ]
+        return [cmd_rsp[0] for cmd_rsp in cmd_rsps] if text else cmd_rsps
+
+    async def cli_batch(
+        self, commands: Sequence[str], text: Optional[bool] = False
+    ) -> list:
+        """
+        This function executes a list of CLI commands using as few JSON-RPC
+        requests as possible.  The commands are packed into requests of at most
+        `batch_size` commands (plugin config), and the requests are sent
+        concurrently.  The results are split back out per command.
+
+        Parameters
+        ----------
+        commands: Sequence[str]
+            The list of EXOS CLI commands.  A command MUST NOT contain a
+            semi-colon since that is the EXOS command separator.
+
+        text: bool, optional
+            When True the results are the CLI text output, otherwise the
+            results are the dict payloads.
+
+        Returns
+        -------
+        A list of results in the same order as the given commands; one item
+        per command.
+        """
+        commands = list(commands)
+        batch_size = max(g_exos.config.batch_size, 1)
+
+        async def run_batch(batch: list[str]) -> list:
+            rsp = await self.cli(batch, text=text)
+
+            # when there is only one command the aio-exos driver does not
+            # return the per-command nested list for dict payloads.
+            return [rsp] if (len(batch) == 1 and not text) else rsp
+
+        batch_results = await asyncio.gather(
+            *(
+                run_batch(commands[offset : offset + batch_size])
+                for offset in range(0, len(commands), batch_size)
+            )
+        )
+
+        return list(chain.from_iterable(batch_results))
+
+    def _api_cache_done(self, key: str, fut: asyncio.Future):
+        """
+        Callback when a cached command completes.  Failed (or cancelled)
+        commands are removed from the cache so they are not served to future
+        callers.
+        """
+        if fut.cancelled() or fut.exception():
+            if self._api_cache.get(key) is fut:
+                del self._api_cache[key]
 
-            return has_data
+    async def restconf(self) -> DeviceExosRestConf:
+        """
+        Returns the RESTCONF client after it is logged into the device.  The
+        login is performed only on first use, and only once per DUT.  When the
+        token cache is enabled, a cached token is used rather than a new
+        login.
+        """
+        return await self.api_cache_call("restconf_login", self._restconf_login)
+
+    async def restconf_get(self, path: str, **kwargs) -> httpx.Response:
+        """
+        This function performs a RESTCONF GET request.  If the device rejects
+        the session token, for example a cached token that the device no longer
+        accepts, then the token is discarded and the request is retried once
+        after a new login.
+
+        Parameters
+        ----------
+        path: str
+            The RESTCONF data path, relative to the RESTCONF data URL.
+
+        Other Parameters
+        ----------------
+        Any keyword-args supported by the httpx `get` method.
+
+        Returns
+        -------
+        The httpx response; the Caller is responsible for checking the status.
+        """
+        # the path is made explicitly relative to the RESTCONF data URL, since
+        # the YANG module prefix of a path, for example "openconfig-platform:",
+        # would otherwise be taken as the URL scheme.
+
+        request = f"restconf GET {path}"
+        url = f"./{path}"
+
+        restc = await self.restconf()
+        used_token = restc.token
+        res = await self._restconf_request(request, partial(restc.get, url, **kwargs))
+
+        if res.status_code == httpx.codes.UNAUTHORIZED:
+            # discard the rejected token, unless a concurrent request has
+            # already done so and logged in again.
+
+            if restc.token == used_token:
+                self._api_cache.pop("restconf_login", None)
+                if g_exos.token_cache:
+                    g_exos.token_cache.remove(self.device.name)
+
+            restc = await self.restconf()
+            res = await self._restconf_request(
+                request, partial(restc.get, url, **kwargs)
+            )
+
+        return res
+
+    async def _restconf_login(self) -> DeviceExosRestConf:
+        """
+        Log into the RESTCONF client, using the cached token if available.
+        """
+        restc = self.exos_restc
+        host = self.device.name
+        token_cache = g_exos.token_cache
+
+        if token_cache and (token := token_cache.get(host)):
+            # apply the token to the client the same way that the aio-exos
+            # login method does.  The base URL is only shifted to the RESTCONF
+            # URL once.
+
+            if restc.token is None:
+                restc.base_url = restc.base_url.join(restc.URL_RESTCONF)
+
+            restc.token = token
+            restc.headers["cookie"] = f"x-auth-token={token}"
+            return restc
+
+        if restc.token is not None:
+            # the base URL was already shifted by a prior login; restore it so
+            # that the login request uses the device auth URL.
+            restc.base_url = restc.base_url.join("/")
+
+        await self._restconf_request("restconf login", restc.login)
+
+        if token_cache:
+            token_cache.set(host, restc.token)
+
+        return restc
+
+    async def _restconf_request(
+        self, request: str, send: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Sends the RESTCONF request with the same limits, retry and circuit
+        breaker policy, timeout, tracing, and instrumentation as the CLI
+        requests; see the `cli` method.
+
+        Parameters
+        ----------
+        request: str
+            The request name, for example "restconf GET <path>", used for the
+            timeout profile, the tracing span, and the instrumentation.
+
+        send: Callable
+            The function that sends the request using the RESTCONF client.
+
+        Returns
+        -------
+        The result of the `send` function.
+        """
+        rsp, latency, retries = await self._api_retry(
+            partial(self._restconf_send, request, send)
+        )
+
+        if api_stats := self.api_stats:
+            rsp_bytes = len(rsp.content) if isinstance(rsp, httpx.Response) else 0
+            api_stats.record(
+                request, latency, response_bytes=rsp_bytes, retries=retries
+            )
+
+        return rsp
+
+    async def _restconf_send(
+        self, request: str, send: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, float]:
+        """
+        Sends the RESTCONF request to the device, and returns the tuple of the
+        result and the request latency.  See the `_cli_request` method.
+        """
+        model = self.device.product_model
+        timeout = g_exos.timeouts.timeout(model, [request])
+
+        async with self._api_inflight, g_exos.api_budget:
+            started = monotonic()
+            try:
+                with self.trace_span("restconf", request=request):
+                    try:
+                        rsp = await asyncio.wait_for(send(), timeout)
+                    except asyncio.TimeoutError as exc:
+                        raise httpx.ReadTimeout(
+                            f"EXOS device {self.device.name}: request timeout "
+                            f"after {timeout}s: {request}"
+                        ) from exc
+
+                    # the RESTCONF GET response status is checked by the
+                    # Caller; except for the status codes that are retried.
+
+                    if (
+                        isinstance(rsp, httpx.Response)
+                        and rsp.status_code in g_exos.config.retry_status_codes
+                    ):
+                        rsp.raise_for_status()
+
+            except Exception as exc:
+                if isinstance(exc, httpx.TimeoutException):
+                    g_exos.timeouts.learn_timeout(model, [request])
+                if api_stats := self.api_stats:
+                    api_stats.record(request, monotonic() - started, error=repr(exc))
+                raise
+
+            latency = monotonic() - started
+
+        g_exos.timeouts.learn(model, [request], latency)
+        return rsp, latency
+
+    # -------------------------------------------------------------------------
+    #
+    #                       EXOS DUT Cached API Methods
+    #
+    # -------------------------------------------------------------------------
+    # These methods are used by the check executors to obtain the device
+    # command results.  Each command is executed at most once per DUT, and the
+    # results are shared by all check executors.  The Caller MUST NOT mutate
+    # the returned data since it is shared.
+    # -------------------------------------------------------------------------
+
+    async def get_ports_info(self) -> list:
+        """returns the results of 'show ports information'"""
+        return await self.api_cache_get("ports_info", "show ports information")
+
+    async def get_ports(self) -> list:
+        """returns the results of 'show ports'"""
+        return await self.api_cache_get("ports", "show ports")
+
+    async def get_port_vlans(self, port_list: str) -> list:
+        """returns the per port VLAN membership for the given port-list"""
+        return await self.api_cache_get(
+            f"port_vlans:{port_list}", f"show ports {port_list} vlan port-number"
+        )
+
+    async def get_port_sharing(self) -> list:
+        """returns the results of 'show port sharing'"""
+        return await self.api_cache_get("port_sharing", "show port sharing")
+
+    async def get_xcvr_info(self) -> list:
+        """returns the results of 'show port transceiver information'"""
+        return await self.api_cache_get(
+            "xcvr_info", "show port transceiver information"
+        )
+
+    async def get_vlans(self) -> list:
+        """returns the results of 'show vlan'"""
+        return await self.api_cache_get("vlans", "show vlan")
+
+    async def get_vlan(self, vlan_name: str) -> list:
+        """
+        Returns the results of 'show vlan <name>' for a specific VLAN.  This is
+        used by the checks that need only a few VLANs; for example the SVI
+        checks.  Use `get_vlan_members` when all VLANs are needed.
+        """
+        return await self.api_cache_get(f"vlan:{vlan_name}", f"show vlan {vlan_name}")
+
+    async def get_vlan_members(self) -> dict[str, list[dict]]:
+        """
+        Returns the VLAN port membership index for all VLANs on the device.
+        The index is built once per DUT using batched 'show vlan <name>'
+        commands.
+
+        Returns
+        -------
+        dict
+            key: str - the VLAN name
+            value: list[dict] - the "vlanProc" records, one per member port.
+        """
+
+        async def build_index():
+            vlan_names = [
+                vlan_info["name1"]
+                for rec in await self.get_vlans()
+                if (vlan_info := rec.get("vlanProc"))
+            ]
+
+            vlan_details = await self.cli_batch(
+                [f"show vlan {vlan_name}" for vlan_name in vlan_names]
+            )
+
+            return {
+                vlan_name: [
+                    vlan_proc
+                    for rec in vlan_detail
+                    if (vlan_proc := rec.get("vlanProc"))
+                ]
+                for vlan_name, vlan_detail in zip(vlan_names, vlan_details)
+            }
+
+        return await self.api_cache_call("vlan_members", build_index)
+
+    async def get_mgmt(self) -> list:
+        """returns the results of 'show mgmt'"""
+        return await self.api_cache_get("mgmt", "show mgmt")
+
+    async def get_ipconfig(self) -> list:
+        """returns the results of 'show ipconfig'"""
+        return await self.api_cache_get("ipconfig", "show ipconfig")
+
+    async def get_lacp(self) -> list:
+        """returns the results of 'show lacp'"""
+        return await self.api_cache_get("lacp", "show lacp")
+
+    async def get_lacp_snapshot(self) -> dict[str, dict]:
+        """
+        Returns the LACP status of all LAGs on the device.  The group details
+        are retrieved using batched 'show lacp lag <id>' commands once per
+        DUT, and shared by the LAG and interface check executors.
+
+        Notes
+        -----
+        This code **ASSUMES** the designer is using the convention where the
+        name of the lag interface is "lag" + the group_id.  This mechanism is
+        employed because the LACP group_id values are overlapping with actual
+        port ID numbers.
+
+        Returns
+        -------
+        dict
+            key: str - the LAG interface name, "lag" + group_id
+            value: dict
+                "lacp": list - the 'show lacp lag <id>' results
+                "interfaces": list - the "lagMemberPortCfg" records
+        """
+
+        async def build_snapshot():
+            lacp_group_ids = [
+                lacp_port["group_id"]
+                for rec in await self.get_lacp()
+                if (lacp_port := rec.get("lacpLagCfg"))
+            ]
+
+            lacp_group_details = await self.cli_batch(
+                [f"show lacp lag {group_id}" for group_id in lacp_group_ids]
+            )
+
+            lacp_by_group = dict()
+
+            for lacp_member_info in lacp_group_details:
+                lacp_port = lacp_member_info[0]["lacpLagCfg"]["group_id"]
+                lacp_by_group["lag" + str(lacp_port)] = dict(
+                    lacp=lacp_member_info,
+                    interfaces=[
+                        port_cfg
+                        for rec in lacp_member_info
+                        if (port_cfg := rec.get("lagMemberPortCfg"))
+                    ],
+                )
+
+            return lacp_by_group
+
+        return await self.api_cache_call("lacp_snapshot", build_snapshot)
+
+    async def get_lldp_neighbors(self) -> list:
+        """returns the results of 'show lldp neighbors'"""
+        return await self.api_cache_get("lldp_neighbors", "show lldp neighbors")
+
+    async def get_switch(self) -> list:
+        """returns the results of 'show switch'"""
+        return await self.api_cache_get("switch", "show switch")
+
+    async def get_version(self) -> list:
+        """returns the results of 'show version'"""
+        return await self.api_cache_get("version", "show version")
+
+    async def get_version_text(self) -> str:
+        """returns the CLI text output of 'show version'"""
+        cli_text = await self.api_cache_get("version_text", "show version", text=True)
+        return cli_text[0]
+
+    async def get_switch_text(self) -> str:
+        """returns the CLI text output of 'show switch'"""
+        cli_text = await self.api_cache_get("switch_text", "show switch", text=True)
+        return cli_text[0]
+
+    async def get_system_info(self) -> Optional[dict]:
+        """
+        Returns the system information; the product model, hostname, serial
+        number, and per-slot software versions.  See `system_info_from_cli`
+        for the details.  The result is also stored in the `system_info`
+        attribute.
+
+        The source is selected by the `device_info_source` plugin config.  When
+        "json", the JSON-RPC dict output of "show switch" and "show version" is
+        used.  When "openconfig", the serial number and software versions are
+        from the RESTCONF openconfig platform data instead of "show version";
+        unless capturing the API responses (RESTCONF is not captured), or the
+        device does not provide the data.  When "text", None is returned.
+
+        A value that is not found is None; the Caller uses the CLI text output
+        for these.
+        """
+        if g_exos.config.device_info_source == "text":
+            return None
+
+        return await self.api_cache_call("system_info", self._build_system_info)
+
+    async def _build_system_info(self) -> dict:
+        """builds the system information returned by `get_system_info`"""
+        oc_info = None
+
+        if g_exos.config.device_info_source == "openconfig" and not self._capture:
+            oc_info = await self._fetch_openconfig_info()
+
+        sh_version = [] if oc_info else await self.get_version()
+        self.system_info = system_info_from_cli(await self.get_switch(), sh_version)
+
+        if oc_info:
+            self.system_info.update(oc_info)
+
+        return self.system_info
+
+    async def _fetch_openconfig_info(self) -> Optional[dict]:
+        """fetches the openconfig data used by `get_system_info`"""
+        headers = {"Accept": "application/yang-data+json"}
+
+        try:
+            res = await self.restconf_get(OC_PLATFORM_COMPONENTS, headers=headers)
+            if not res.is_success:
+                return None
+
+            oc_info = system_info_from_openconfig(components=res.json())
+
+        except (httpx.HTTPError, ValueError, AttributeError):
+            return None
+
+        # the "show version" output is used when the data does not provide the
+        # software version of the switch, or of every stack slot.
+
+        return oc_info if oc_info and oc_info["software_version"] else None
 
     # -------------------------------------------------------------------------
     #
@@ -147,16 +1052,63 @@ class EXOSDeviceUnderTest(AsyncDeviceUnderTest):
 
     async def setup(self):
         """DUT setup process"""
-        await super().setup()
+        with self.trace_span("setup"):
+            await self._setup()
+
+    async def teardown(self):
+        """DUT tearndown process"""
+        with self.trace_span("teardown"):
+            await self._teardown()
+
+    async def _setup(self):
+        """
+        Prepares the DUT; checks the device is reachable and retrieves the
+        data needed by the checks.
+        """
+
+        # if the fleet pre-scan found the device unreachable, then fail now
+        # rather than waiting for the connect timeout.
 
-        if not await port_check_url(self.exos_jrpc.base_url):
+        await prescan_device(self.device)
+
+        if g_exos.reachable.get(self.device.name) is False:
             raise SetupError(
                 f"Unable to connect to EXOS device: {self.device.name}: "
                 "Device offline or EXOS API is not enabled, check config."
             )
 
+        await super().setup()
+
+        self.if_roles = EXosInterfaceRoles.from_design(
+            device=self.device, device_info=self.device_info
+        )
+
+        # the shared transport connection pool is closed when the last DUT
+        # is torn down.
+
+        g_exos.transport.acquire()
+        self._transport_acquired = True
+
+        # The device reachability check is folded into the first API request
+        # rather than opening a separate TCP connection to probe the port.  A
+        # connect failure is reported as a SetupError, same as a failed port
+        # probe.  The first request retrieves the "show switch" output that is
+        # cached for the device-info check, and the connection is kept in the
+        # shared connection pool for the following API requests.  The RESTCONF
+        # login is deferred until a RESTCONF request is needed.
+
         try:
-            await self.exos_restc.login()
+            if g_exos.config.device_info_source == "text":
+                await self.get_switch_text()
+            else:
+                await self.get_switch()
+
+        except (httpx.ConnectError, httpx.ConnectTimeout) as exc:
+            await self.teardown()
+            raise SetupError(
+                f"Unable to connect to EXOS device: {self.device.name}: "
+                "Device offline or EXOS API is not enabled, check config."
+            ) from exc
 
         except httpx.HTTPError as exc:
             rt_exc = RuntimeError(
@@ -166,11 +1118,57 @@ class EXOSDeviceUnderTest(AsyncDeviceUnderTest):
             await self.teardown()
             raise rt_exc
 
-    async def teardown(self):
-        """DUT tearndown process"""
+        # netcam dispatches the check collections to the DUT one at a time, so
+        # the DUT plans the prefetch from the check collection types of the
+        # device design services rather than waiting for each dispatch.  The
+        # requests of collection types that the device design does not use are
+        # not sent.
+
+        if g_exos.config.prefetch:
+            self.prefetch(self.design_collection_types())
+
+    async def _teardown(self):
+        """
+        Saves the capture archive and instrumentation summary, if enabled, and
+        closes the API clients.  The shared connection pool is closed, and the
+        API budget counters are reported, when the last DUT is torn down.
+        """
+        # cancel the prefetch requests, and any cached request still in
+        # flight, and wait for them to finish before the API clients are
+        # closed.
+
+        pending = [
+            fut
+            for fut in (*self._prefetch_tasks, *self._api_cache.values())
+            if not fut.done()
+        ]
+        for fut in pending:
+            fut.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        if self._capture and g_exos.config.capture_mode == "record":
+            await asyncio.to_thread(self._capture.save)
+
+        if self.api_stats:
+            summary = self.api_stats.summary()
+            for hook in self.api_stats.hooks:
+                hook.on_teardown(self.device.name, summary)
+
         await self.exos_restc.aclose()
         await self.exos_jrpc.aclose()
 
+        # the API budget counters are reported to the instrumentation hooks
+        # when the last DUT is torn down; i.e. once all the DUT API requests
+        # are complete.
+
+        if self._transport_acquired:
+            self._transport_acquired = False
+            if await g_exos.transport.release():
+                api_budget = g_exos.api_budget.stats()
+                for hook in g_exos.instrument_hooks:
+                    hook.on_close(api_budget)
+
     @singledispatchmethod
     async def execute_checks(
         self, checks: CheckCollection
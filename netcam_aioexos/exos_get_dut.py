@@ -22,6 +22,7 @@ from netcad.device import Device
 # Private Imports
 # -----------------------------------------------------------------------------
 
+from .exos_plugin_globals import g_exos
 from .exos_dut import EXOSDeviceUnderTest
 
 # -----------------------------------------------------------------------------
@@ -63,4 +64,10 @@ def plugin_get_dut(device: Device) -> EXOSDeviceUnderTest:
             f"Missing required DUT class for device {device.name}, os_name: {device.os_name}"
         )
 
+    # the devices are pre-scanned by the first DUT setup; see the `prescan`
+    # plugin config.
+
+    if g_exos.config.prescan:
+        g_exos.prescan_pending.append(device)
+
     return EXOSDeviceUnderTest(device=device)
@@ -0,0 +1,106 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from dataclasses import dataclass, field
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+from netcad.device import Device
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EXosInterfaceRoles"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class EXosInterfaceRoles:
+    """
+    Define a class to index the design interfaces by their role.  The index is
+    built once when the DUT is set up and is then used by the check executors
+    rather than each check walking the design interfaces.
+
+    Attributes
+    ----------
+    virtual: set[str]
+        The names of the virtual interfaces; for example VLAN SVIs.
+
+    lags: set[str]
+        The names of the LAG interfaces.
+
+    lag_members: dict[str, list[str]]
+        The LAG interface name to the list of member interface names.
+
+    reserved: set[str]
+        The names of the interfaces marked as "is_reserved" in the design.
+
+    disabled: set[str]
+        The names of the interfaces that are disabled in the design.
+    """
+
+    virtual: set[str] = field(default_factory=set)
+    lags: set[str] = field(default_factory=set)
+    lag_members: dict[str, list[str]] = field(default_factory=dict)
+    reserved: set[str] = field(default_factory=set)
+    disabled: set[str] = field(default_factory=set)
+
+    @classmethod
+    def from_design(cls, device: Device, device_info: dict) -> "EXosInterfaceRoles":
+        """
+        Build the interface roles index from the device design.
+
+        Parameters
+        ----------
+        device: Device
+            The device instance, used to obtain the LAG member interfaces.
+
+        device_info: dict
+            The DUT device information; the "interfaces" key contains the
+            design interface data.
+        """
+        roles = cls()
+
+        for if_name, if_info in device_info["interfaces"].items():
+            if_flags = if_info["profile_flags"]
+
+            if if_flags.get("is_virtual", False):
+                roles.virtual.add(if_name)
+
+            if if_flags.get("is_reserved", False):
+                roles.reserved.add(if_name)
+
+            if if_info["enabled"] is False:
+                roles.disabled.add(if_name)
+
+            if if_flags.get("is_lag", False):
+                roles.lags.add(if_name)
+                roles.lag_members[if_name] = [
+                    lag_intf.name
+                    for lag_intf in device.interfaces[if_name].profile.if_lag_members
+                ]
+
+        return roles
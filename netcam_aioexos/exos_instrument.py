@@ -0,0 +1,230 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, TextIO
+from dataclasses import dataclass, asdict
+from collections import defaultdict
+from pathlib import Path
+import json
+import sys
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "EXosCommandEvent",
+    "EXosInstrumentHook",
+    "EXosStatsFileHook",
+    "EXosStatsStreamHook",
+    "EXosCommandStats",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class EXosCommandEvent:
+    """
+    Define the measurements of one CLI command executed by a DUT.
+
+    Attributes
+    ----------
+    device: str
+        The device name.
+
+    command: str
+        The CLI command.
+
+    latency: float
+        The number of seconds to obtain the command result.  For a command in
+        a batched request, this is the latency of the request.
+
+    response_bytes: int
+        The size of the command result; the JSON encoded size for dict
+        results, or the text size.
+
+    records: int
+        The number of result records; or lines for text results.
+
+    cache_hit: bool
+        True when the result was served from the DUT cache.
+
+    retries: int
+        The number of times the request was retried.
+
+    error: str, optional
+        The error, if the command failed.
+    """
+
+    device: str
+    command: str
+    latency: float
+    response_bytes: int = 0
+    records: int = 0
+    cache_hit: bool = False
+    retries: int = 0
+    error: Optional[str] = None
+
+
+class EXosInstrumentHook:
+    """
+    The base class for instrumentation hooks.  A hook instance is added to the
+    `g_exos.instrument_hooks` list, and is then called for every command
+    executed by every DUT, when each DUT is torn down, and when the last DUT
+    is torn down.
+    """
+
+    def on_command(self, event: EXosCommandEvent):
+        """called for each command executed, or served from the cache"""
+        pass
+
+    def on_teardown(self, device: str, summary: dict):
+        """called when the DUT is torn down with the DUT command summary"""
+        pass
+
+    def on_close(self, api_budget: dict):
+        """
+        called when the last DUT is torn down with the API budget counters; see
+        the EXosApiBudget `stats` method.
+        """
+        pass
+
+
+class EXosStatsFileHook(EXosInstrumentHook):
+    """
+    This hook appends the command summary of each DUT, as one JSON line, to a
+    file when the DUT is torn down; and the API budget counters, as one JSON
+    line, when the last DUT is torn down.  The hook is used when the plugin
+    config `instrument_file` is set.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path).expanduser()
+
+    def on_teardown(self, device: str, summary: dict):
+        with self.path.open("a") as ofile:
+            ofile.write(_summary_line(device, summary))
+
+    def on_close(self, api_budget: dict):
+        with self.path.open("a") as ofile:
+            ofile.write(_budget_line(api_budget))
+
+
+class EXosStatsStreamHook(EXosInstrumentHook):
+    """
+    This hook writes the command summary of each DUT, as one JSON line, to a
+    stream, by default stderr, when the DUT is torn down; and the API budget
+    counters, as one JSON line, when the last DUT is torn down.  The hook is
+    used when the plugin config `instrument` is enabled and `instrument_file`
+    is not set.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def on_teardown(self, device: str, summary: dict):
+        stream = self.stream or sys.stderr
+        stream.write(_summary_line(device, summary))
+        stream.flush()
+
+    def on_close(self, api_budget: dict):
+        stream = self.stream or sys.stderr
+        stream.write(_budget_line(api_budget))
+        stream.flush()
+
+
+def _summary_line(device: str, summary: dict) -> str:
+    """returns the JSON line of the DUT command summary"""
+    return json.dumps(dict(device=device, commands=summary)) + "\n"
+
+
+def _budget_line(api_budget: dict) -> str:
+    """returns the JSON line of the API budget counters"""
+    return json.dumps(dict(api_budget=api_budget)) + "\n"
+
+
+class EXosCommandStats:
+    """
+    The EXosCommandStats collects the command events of one DUT, passes each
+    event to the instrumentation hooks, and produces the per-command summary.
+    """
+
+    def __init__(self, device: str, hooks: list[EXosInstrumentHook]):
+        self.device = device
+        self.hooks = hooks
+        self.events: list[EXosCommandEvent] = list()
+
+    def record(self, command: str, latency: float, **kwargs) -> EXosCommandEvent:
+        """records the command event and calls the hooks"""
+        event = EXosCommandEvent(
+            device=self.device, command=command, latency=latency, **kwargs
+        )
+        self.events.append(event)
+
+        for hook in self.hooks:
+            hook.on_command(event)
+
+        return event
+
+    @staticmethod
+    def result_size(result) -> tuple[int, int]:
+        """returns the (response_bytes, records) of a command result"""
+        if isinstance(result, str):
+            return len(result.encode()), result.count("\n")
+
+        return len(json.dumps(result)), len(result)
+
+    def summary(self) -> dict:
+        """
+        Returns the per-command summary; the command is the key, and the value
+        is a dictionary of counters sorted by total latency, slowest first.
+        """
+        by_cmd = defaultdict(
+            lambda: dict(
+                count=0,
+                cache_hits=0,
+                errors=0,
+                retries=0,
+                total_latency=0.0,
+                max_latency=0.0,
+                response_bytes=0,
+                records=0,
+            )
+        )
+
+        for event in self.events:
+            cmd_stats = by_cmd[event.command]
+            cmd_stats["count"] += 1
+            cmd_stats["cache_hits"] += event.cache_hit
+            cmd_stats["errors"] += event.error is not None
+            cmd_stats["retries"] += event.retries
+            cmd_stats["total_latency"] += event.latency
+            cmd_stats["max_latency"] = max(cmd_stats["max_latency"], event.latency)
+            cmd_stats["response_bytes"] += event.response_bytes
+            cmd_stats["records"] += event.records
+
+        return dict(sorted(by_cmd.items(), key=lambda item: -item[1]["total_latency"]))
+
+    def dump(self) -> list[dict]:
+        """returns all the command events as dictionaries"""
+        return [asdict(event) for event in self.events]
@@ -16,7 +16,8 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Optional
+from typing import Optional, Literal
+from pathlib import Path
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -69,3 +70,115 @@ class EXosPluginConfig(BaseModel, extra=Extra.forbid):
 
     env: EXosPluginEnvConfig
     timeout: int = 60
+
+    # the per-command request timeouts; the key is a command pattern, for
+    # example "show port transceiver *", and the value is the timeout in
+    # seconds.  The first matching pattern is used, otherwise `timeout`.  The
+    # RESTCONF requests are matched as "restconf GET <path>" and "restconf
+    # login".
+    timeouts: dict[str, float] = {}
+
+    # when enabled, the p99 latency of each command is learned per device
+    # model.  Once there are `adaptive_min_samples` samples, the command
+    # timeout is the p99 latency times `adaptive_factor`; no less than
+    # `adaptive_floor` seconds, and no more than the configured timeout.  A
+    # request timeout discards the learned latency of its commands.
+    adaptive_timeouts: bool = False
+    adaptive_factor: float = 3.0
+    adaptive_floor: float = 2.0
+    adaptive_min_samples: int = 50
+
+    # the protocol used to access the device APIs; "http" is used with the
+    # local simulator.
+    proto: Literal["http", "https"] = "https"
+
+    # an optional JSON file that maps device names to the "host:port" used to
+    # access the device APIs; for example the hosts file created by the local
+    # simulator.  Devices not in the map are accessed by device name.
+    hosts_file: Optional[Path] = None
+
+    # the source of the device-info check data.  When "json", the JSON-RPC
+    # dict output of "show switch" and "show version" is used.  When
+    # "openconfig", the serial number and per-slot software versions are from
+    # the RESTCONF openconfig platform data instead of "show version"; this
+    # requires a RESTCONF login.  When "text", the CLI text output is used.
+    # The CLI text output is also used for any values that are not found in
+    # the "json" or "openconfig" data.
+    device_info_source: Literal["json", "openconfig", "text"] = "json"
+
+    # the number of seconds to wait for a connection to a device; this is kept
+    # short so that an offline device fails fast during DUT setup.
+    connect_timeout: int = 5
+
+    # the maximum number of CLI commands packed into a single JSON-RPC request
+    # when using the DUT `cli_batch` method.
+    batch_size: int = 25
+
+    # the number of times an API request that fails with a transport error,
+    # for example a dropped connection, or with one of the HTTP
+    # `retry_status_codes`, is retried.  A request timeout is not retried; see
+    # `breaker_threshold`.  The retries are delayed using a jittered
+    # exponential backoff, starting from `retry_backoff` seconds and at most
+    # `retry_backoff_max` seconds.
+    retries: int = 2
+    retry_backoff: float = 0.5
+    retry_backoff_max: float = 10.0
+    retry_status_codes: list[int] = [502, 503, 504]
+
+    # the number of consecutive API request timeouts after which the DUT stops
+    # accessing the device; all remaining requests fail immediately.  A value
+    # of zero disables the circuit breaker.
+    breaker_threshold: int = 3
+
+    # the maximum number of concurrent API requests sent to any one device.
+    max_inflight_per_device: int = 4
+
+    # the maximum number of concurrent API requests across all devices.
+    max_inflight_total: int = 200
+
+    # the number of seconds an idle connection in the shared connection pool
+    # is kept alive.
+    keepalive_expiry: float = 30.0
+
+    # when enabled, the first DUT setup pre-scans the reachability of all the
+    # devices in the run; see `plugin_prescan`.  The maximum number of
+    # concurrent port probes, and the probe timeout in seconds, are used by
+    # the pre-scan.
+    prescan: bool = False
+    prescan_concurrency: int = 500
+    prescan_timeout: int = 5
+
+    # when set, the RESTCONF session tokens are stored in this directory and
+    # reused across runs for up to `token_lifetime` seconds.
+    token_cache_dir: Optional[Path] = None
+    token_lifetime: int = 900
+
+    # when set to "record", every JSON-RPC CLI response is saved to a
+    # per-device archive in the `capture_dir` directory.  When set to "replay",
+    # the responses are served from those archives with no device access.
+    capture_mode: Optional[Literal["record", "replay"]] = None
+    capture_dir: Path = Path("exos-captures")
+
+    # when enabled, the DUTs measure every CLI command; latency, response size,
+    # record count, cache hits, and retries.  The per-command summary of each
+    # DUT is written, as a JSON line, at DUT teardown; to stderr, or appended
+    # to the `instrument_file` when set.  The `max_inflight_total` API budget
+    # counters are written, as a JSON line, when the last DUT is torn down.
+    # Setting `instrument_file` also enables instrumentation.
+    instrument: bool = False
+    instrument_file: Optional[Path] = None
+
+    # when enabled, the DUT starts the API requests used by the check
+    # collections of the device design services concurrently, at the end of
+    # setup, rather than each check executor issuing its requests when
+    # dispatched.
+    prefetch: bool = False
+
+    # when set to "file", the DUT setup, teardown, check executors, and CLI
+    # commands are traced as spans written, as JSON lines, to `tracing_file`.
+    # When set to "otlp", the spans are exported to the OpenTelemetry
+    # collector at `tracing_endpoint`; this requires the opentelemetry-sdk and
+    # opentelemetry-exporter-otlp packages.
+    tracing: Optional[Literal["file", "otlp"]] = None
+    tracing_file: Path = Path("exos-traces.jsonl")
+    tracing_endpoint: Optional[str] = None
@@ -17,15 +17,23 @@
 # -----------------------------------------------------------------------------
 
 from typing import Optional, Tuple
+import asyncio
 
 # -----------------------------------------------------------------------------
 # Public Imports
 # -----------------------------------------------------------------------------
 
 import httpx
+from netcad.device import Device
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .exos_plugin_config import EXosPluginConfig
+from .exos_api_budget import EXosApiBudget
+from .exos_transport import EXosSharedTransport
+from .exos_token_cache import EXosTokenCache
+from .exos_instrument import EXosInstrumentHook
+from .exos_tracing import EXosTracer
+from .exos_timeouts import EXosTimeoutProfiles
 
 
 @dataclass
@@ -51,12 +59,64 @@ class EXosGlobals:
     config: dict
         This is the plugin configuration dictionary as declared in the User
         `netcad.toml` configuration file.
+
+    api_budget: EXosApiBudget
+        The process-wide concurrency budget that every DUT acquires from
+        before sending an API request to a device.
+
+    transport: EXosSharedTransport
+        The HTTP transport, with a single connection pool and SSL context,
+        shared by the API clients of all DUTs.
+
+    reachable: dict[str, bool]
+        The device name to reachability map as determined by the fleet
+        pre-scan, `plugin_prescan`.  A device that is not in the map has not
+        been pre-scanned.
+
+    prescan_pending: list[Device]
+        The devices, obtained by netcam via `plugin_get_dut`, that are waiting
+        to be pre-scanned when the `prescan` plugin config is enabled.
+
+    prescan_tasks: dict[str, asyncio.Future]
+        The device name to the pre-scan task that probes the device.
+
+    token_cache: EXosTokenCache
+        The on-disk RESTCONF token cache, when enabled by the plugin config.
+
+    hosts: dict[str, str]
+        The device name to "host:port" map loaded from the plugin config
+        `hosts_file`.
+
+    instrument_hooks: list[EXosInstrumentHook]
+        The instrumentation hooks called by every DUT for each CLI command and
+        at teardown.  Adding a hook enables the DUT instrumentation.
+
+    tracer: EXosTracer
+        The span tracer used by every DUT, when enabled by the plugin config.
+
+    timeouts: EXosTimeoutProfiles
+        The API request timeouts, shared by all DUTs so that the adaptive
+        timeouts are learned across the devices of the same model.
     """
 
     basic_auth: Optional[httpx.BasicAuth] = None
     basic_auth_rw: Optional[httpx.BasicAuth] = None
     config: Optional[EXosPluginConfig] = None
     scp_creds: Optional[Tuple[str, str]] = None
+    api_budget: Optional[EXosApiBudget] = None
+    transport: Optional[EXosSharedTransport] = None
+    reachable: dict[str, bool] = field(default_factory=dict)
+    prescan_pending: list[Device] = field(default_factory=list)
+    prescan_tasks: dict[str, asyncio.Future] = field(default_factory=dict)
+    token_cache: Optional[EXosTokenCache] = None
+    hosts: dict[str, str] = field(default_factory=dict)
+    instrument_hooks: list[EXosInstrumentHook] = field(default_factory=list)
+    tracer: Optional[EXosTracer] = None
+    timeouts: Optional[EXosTimeoutProfiles] = None
+
+    def device_host(self, device_name: str) -> str:
+        """returns the "host[:port]" used to access the device APIs"""
+        return self.hosts.get(device_name, device_name)
 
 
 # -----------------------------------------------------------------------------
@@ -12,11 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import json
+
 from pydantic import ValidationError
 import httpx
 
 from .exos_plugin_globals import g_exos
 from .exos_plugin_config import EXosPluginConfig
+from .exos_api_budget import EXosApiBudget
+from .exos_transport import EXosSharedTransport
+from .exos_token_cache import EXosTokenCache
+from .exos_instrument import EXosStatsFileHook, EXosStatsStreamHook
+from .exos_tracing import EXosFileTracer, EXosOtlpTracer
+from .exos_timeouts import EXosTimeoutProfiles
 
 
 def plugin_init(plugin_def: dict):
@@ -54,6 +62,28 @@ def exos_plugin_config(config: dict):
     except ValidationError as exc:
         raise RuntimeError(f"Failed to load EXOS plugin configuration: {str(exc)}")
 
+    g_exos.api_budget = EXosApiBudget(limit=g_exos.config.max_inflight_total)
+    g_exos.transport = EXosSharedTransport(config=g_exos.config)
+    g_exos.timeouts = EXosTimeoutProfiles(config=g_exos.config)
+
+    if instrument_file := g_exos.config.instrument_file:
+        g_exos.instrument_hooks.append(EXosStatsFileHook(instrument_file))
+    elif g_exos.config.instrument:
+        g_exos.instrument_hooks.append(EXosStatsStreamHook())
+
+    if g_exos.config.tracing == "file":
+        g_exos.tracer = EXosFileTracer(g_exos.config.tracing_file)
+    elif g_exos.config.tracing == "otlp":
+        g_exos.tracer = EXosOtlpTracer(g_exos.config.tracing_endpoint)
+
+    if hosts_file := g_exos.config.hosts_file:
+        g_exos.hosts = json.loads(hosts_file.expanduser().read_text())
+
+    if token_cache_dir := g_exos.config.token_cache_dir:
+        g_exos.token_cache = EXosTokenCache(
+            cache_dir=token_cache_dir, lifetime=g_exos.config.token_lifetime
+        )
+
     g_exos.basic_auth = httpx.BasicAuth(
         username=g_exos.config.env.read.username.get_secret_value(),
         password=g_exos.config.env.read.password.get_secret_value(),
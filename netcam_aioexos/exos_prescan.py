@@ -0,0 +1,111 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Iterable
+import asyncio
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+from httpx import URL
+from netcad.device import Device
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .exos_plugin_globals import g_exos
+from .aio_portcheck import port_check_urls
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["plugin_prescan", "prescan_device"]
+
+# -----------------------------------------------------------------------------
+#
+#                            CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+async def plugin_prescan(devices: Iterable[Device]) -> dict[str, bool]:
+    """
+    This function probes the EXOS API port of all the given devices
+    concurrently, before any DUT is constructed.  The resulting reachability
+    map is stored in `g_exos.reachable` so that the DUT setup of an
+    unreachable device fails immediately rather than waiting for the connect
+    timeout.
+
+    The number of concurrent probes and the probe timeout are set by the
+    `prescan_concurrency` and `prescan_timeout` plugin config.
+
+    Parameters
+    ----------
+    devices: Iterable[Device]
+        The devices in the netcam run.  Only the devices with os_name=="exos"
+        are probed.
+
+    Returns
+    -------
+    The mapping of device name to True if reachable; False otherwise.
+    """
+    proto = g_exos.config.proto
+
+    dev_urls = {
+        device.name: URL(f"{proto}://{g_exos.device_host(device.name)}")
+        for device in devices
+        if device.os_name == "exos"
+    }
+
+    url_ok = await port_check_urls(
+        dev_urls.values(),
+        concurrency=g_exos.config.prescan_concurrency,
+        timeout=g_exos.config.prescan_timeout,
+    )
+
+    reachable = {dev_name: url_ok[url] for dev_name, url in dev_urls.items()}
+    g_exos.reachable.update(reachable)
+    return reachable
+
+
+async def prescan_device(device: Device):
+    """
+    Waits for the pre-scan of the device, when the `prescan` plugin config is
+    enabled.  The DUT setup calls this function before checking the device
+    reachability.
+
+    The first call pre-scans all the devices obtained by netcam, via
+    `plugin_get_dut`, so far; the concurrent DUT setups of those devices wait
+    for the same pre-scan.  A device obtained after that pre-scan started is
+    pre-scanned, with any other such devices, by the next call.
+
+    Parameters
+    ----------
+    device: Device
+        The device of the DUT being set up.
+    """
+    if pending := g_exos.prescan_pending:
+        g_exos.prescan_pending = []
+        task = asyncio.ensure_future(plugin_prescan(pending))
+        g_exos.prescan_tasks.update(dict.fromkeys((dev.name for dev in pending), task))
+
+    if task := g_exos.prescan_tasks.get(device.name):
+        await asyncio.shield(task)
@@ -0,0 +1,106 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# This file contains the retry backoff and per-device circuit breaker used by
+# the DUT for the device API requests.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional
+import random
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import httpx
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EXosCircuitBreaker", "EXosCircuitOpenError", "retry_delay"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class EXosCircuitOpenError(httpx.TransportError):
+    """
+    Raised for an API request to a device whose circuit breaker is open; that
+    is, the device has timed out too many times and is no longer accessed.
+    """
+
+
+class EXosCircuitBreaker:
+    """
+    The per-device circuit breaker.  Each request timeout is counted as a
+    failure, and a successful request resets the count.  Once the number of
+    consecutive failures reaches the threshold the breaker is opened, and
+    stays open, so that all remaining requests to the device fail immediately
+    rather than each waiting for the request timeout.
+
+    Parameters
+    ----------
+    device_name: str
+        The device name, used in the error message.
+
+    threshold: int
+        The number of consecutive timeouts that opens the breaker.  A value of
+        zero disables the breaker.
+    """
+
+    def __init__(self, device_name: str, threshold: int):
+        self.device_name = device_name
+        self.threshold = threshold
+        self.failures = 0
+        self.last_error: Optional[Exception] = None
+
+    @property
+    def is_open(self) -> bool:
+        return 0 < self.threshold <= self.failures
+
+    def check(self):
+        """
+        Raises the EXosCircuitOpenError when the breaker is open.
+        """
+        if self.is_open:
+            raise EXosCircuitOpenError(
+                f"EXOS device {self.device_name}: API access stopped after "
+                f"{self.failures} consecutive timeouts: {self.last_error!r}"
+            )
+
+    def success(self):
+        self.failures = 0
+
+    def failure(self, error: Exception):
+        """counts the error when it is a request timeout"""
+        if isinstance(error, httpx.TimeoutException):
+            self.failures += 1
+            self.last_error = error
+
+
+def retry_delay(attempt: int, backoff: float, backoff_max: float) -> float:
+    """
+    Returns the number of seconds to wait before the given retry attempt,
+    starting at 1; the exponential backoff with "full jitter".
+    """
+    return random.uniform(0, min(backoff_max, backoff * 2 ** (attempt - 1)))
@@ -0,0 +1,191 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# This file contains the functions that build the DUT system information; the
+# product model, hostname, serial number, and per-slot software versions.  The
+# information is built from the JSON-RPC dict output of "show switch" and
+# "show version", or from the RESTCONF openconfig-platform data.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional
+import re
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "OC_PLATFORM_COMPONENTS",
+    "system_info_from_cli",
+    "system_info_from_openconfig",
+    "system_info_from_versions",
+]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# the RESTCONF data path
+OC_PLATFORM_COMPONENTS = "openconfig-platform:components"
+
+# the stack member components, and "show version" boards, are named
+# "Slot-<N>"
+_re_slot_name = re.compile(r"Slot-(\d+)$")
+
+
+def system_info_from_cli(sh_switch: list[dict], sh_version: list[dict]) -> dict:
+    """
+    Returns the system information from the JSON-RPC dict output of the "show
+    switch" and "show version" commands.  A value that is not found in the
+    output is None; the Caller uses the CLI text output for these.
+
+    Parameters
+    ----------
+    sh_switch: list[dict]
+        The "show switch" records; the "show_switch" record provides the
+        "sysName" and "sysType" values.
+
+    sh_version: list[dict]
+        The "show version" records; one "show_version" record per board, the
+        standalone "Switch" or each stack "Slot-<N>".
+
+    Returns
+    -------
+    dict
+        product_model: str - the EXOS system type, for example "X465-48T"
+        hostname: str
+        serial, software_version, slots: see `system_info_from_versions`
+    """
+    switch = next((rec["show_switch"] for rec in sh_switch if "show_switch" in rec), {})
+
+    versions = [
+        dict(
+            slot_id=(mo.group(1) if (mo := _re_slot_name.match(board)) else None),
+            part_no=version.get("partNumber"),
+            serial=version.get("serialNumber"),
+            sw_ver=version.get("imageVersion"),
+        )
+        for rec in sh_version
+        if (version := rec.get("show_version"))
+        and (board := version.get("board", "")).startswith(("Switch", "Slot-"))
+    ]
+
+    return dict(
+        product_model=switch.get("sysType"),
+        hostname=switch.get("sysName"),
+        **system_info_from_versions(versions),
+    )
+
+
+def system_info_from_versions(versions: list[dict]) -> dict:
+    """
+    Returns the serial number and software version information from the
+    per-board versions.
+
+    Parameters
+    ----------
+    versions: list[dict]
+        One per board; slot_id, part_no, serial, and sw_ver.  The slot_id of
+        a standalone switch is None.
+
+    Returns
+    -------
+    dict
+        serial: str - the serial number of the switch, or of the first stack
+            slot.
+        software_version: dict | list[dict]
+            A switch is {"sw_ver": str}; a stack is a list of
+            {"slot_id": str, "sw_ver": str}, one per slot.  This is None when
+            the version of the switch, or of any stack slot, is not known.
+        slots: list[dict]
+            One per stack slot; slot_id, part_no, serial, and sw_ver.
+    """
+    slots = [version for version in versions if version["slot_id"]]
+    switch = next((version for version in versions if not version["slot_id"]), {})
+
+    if slots:
+        software_version = [
+            dict(slot_id=slot["slot_id"], sw_ver=slot["sw_ver"]) for slot in slots
+        ]
+    else:
+        software_version = dict(sw_ver=switch.get("sw_ver"))
+
+    if not all(ver["sw_ver"] for ver in (slots or [software_version])):
+        software_version = None
+
+    return dict(
+        serial=(slots[0] if slots else switch).get("serial"),
+        software_version=software_version,
+        slots=slots,
+    )
+
+
+def system_info_from_openconfig(components: dict) -> Optional[dict]:
+    """
+    Returns the serial number and software version information from the
+    openconfig platform data, or None when the data does not provide the
+    chassis.  The product model and hostname are not included; the
+    openconfig chassis description is not the EXOS system type, for example
+    "X465-48T-SwitchStack", so these are from "show switch".
+
+    Parameters
+    ----------
+    components: dict
+        The RESTCONF response body of the `OC_PLATFORM_COMPONENTS` path.
+
+    Returns
+    -------
+    dict
+        See `system_info_from_versions`; the serial number is the chassis
+        serial number.
+    """
+    oc_comps = components.get("openconfig-platform:components") or components
+    comp_states = [comp.get("state", {}) for comp in oc_comps.get("component", [])]
+
+    chassis = next(
+        (state for state in comp_states if state.get("type", "").endswith("CHASSIS")),
+        None,
+    )
+
+    if not chassis:
+        return None
+
+    slots = [
+        dict(
+            slot_id=mo.group(1),
+            part_no=state.get("part-no"),
+            serial=state.get("serial-no"),
+            sw_ver=state.get("software-version"),
+        )
+        for state in comp_states
+        if (mo := _re_slot_name.match(state.get("name", "")))
+    ]
+
+    switch = dict(
+        slot_id=None,
+        part_no=chassis.get("part-no"),
+        serial=chassis.get("serial-no"),
+        sw_ver=chassis.get("software-version"),
+    )
+
+    return dict(
+        system_info_from_versions(slots or [switch]), serial=chassis.get("serial-no")
+    )
@@ -0,0 +1,173 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# This file contains the per-command API request timeout profiles, and the
+# adaptive timeouts learned from the command latency per device model.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Sequence
+from collections import deque
+from fnmatch import fnmatchcase
+import math
+import re
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .exos_plugin_config import EXosPluginConfig
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EXosTimeoutProfiles"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# the number of latency samples kept per device model and command.
+LATENCY_SAMPLES = 1000
+
+# the p99 latency is recomputed, when used, after this many new samples.
+P99_REFRESH = 20
+
+# used to replace the port, slot, and VLAN numbers in the commands so that, for
+# example, "show ports 1:1" and "show ports 2:1" share the learned latency.
+_re_numbers = re.compile(r"\d[\d:,\-]*")
+
+
+class _LatencyStats:
+    """the latency samples, and learned p99, of one device model and command"""
+
+    def __init__(self):
+        self.samples: deque[float] = deque(maxlen=LATENCY_SAMPLES)
+        self.added = 0
+        self._p99 = 0.0
+        self._p99_added = 0
+
+    def add(self, latency: float):
+        self.samples.append(latency)
+        self.added += 1
+
+    @property
+    def p99(self) -> float:
+        """
+        The p99 latency of the samples.  This is computed when first used, and
+        then recomputed when used after `P99_REFRESH` new samples; so the p99
+        always reflects the samples that the timeout is based on.
+        """
+        if not self._p99_added or self.added - self._p99_added >= P99_REFRESH:
+            ordered = sorted(self.samples)
+            self._p99 = ordered[math.ceil(len(ordered) * 0.99) - 1]
+            self._p99_added = self.added
+
+        return self._p99
+
+
+class EXosTimeoutProfiles:
+    """
+    This class determines the timeout of each API request.  The timeout of a
+    command is the value of the first `timeouts` plugin config pattern that
+    matches the command, otherwise the `timeout` plugin config.
+
+    When the `adaptive_timeouts` plugin config is enabled, the latency of the
+    successful requests is learned per device model and command.  Once there
+    are `adaptive_min_samples` samples, the command timeout is the learned p99
+    latency multiplied by `adaptive_factor`; no less than `adaptive_floor`, and
+    no more than the profile timeout.  A request timeout discards the learned
+    latency of its commands, since only the successful requests are sampled,
+    so that the commands use the profile timeout until they are relearned.
+
+    The timeout of a batched request is the sum of the command timeouts, since
+    the device runs the commands one after another; no more than the largest
+    command timeout, `max_timeout`, which is the API client read timeout.
+
+    Parameters
+    ----------
+    config: EXosPluginConfig
+        The plugin configuration.
+    """
+
+    def __init__(self, config: EXosPluginConfig):
+        self.config = config
+        self._latency: dict[tuple[str, str], _LatencyStats] = dict()
+
+    @property
+    def max_timeout(self) -> float:
+        """the largest timeout of any command"""
+        return max([self.config.timeout, *self.config.timeouts.values()])
+
+    def profile_timeout(self, command: str) -> float:
+        """returns the configured timeout for the command"""
+        for pattern, timeout in self.config.timeouts.items():
+            if fnmatchcase(command, pattern):
+                return timeout
+
+        return self.config.timeout
+
+    def command_timeout(self, model: str, command: str) -> float:
+        """returns the timeout for the command on the device model"""
+        timeout = self.profile_timeout(command)
+
+        if not self.config.adaptive_timeouts:
+            return timeout
+
+        stats = self._latency.get((model, _re_numbers.sub("#", command)))
+        min_samples = max(self.config.adaptive_min_samples, 1)
+        if not stats or len(stats.samples) < min_samples:
+            return timeout
+
+        learned = stats.p99 * self.config.adaptive_factor
+        return min(max(learned, self.config.adaptive_floor), timeout)
+
+    def timeout(self, model: str, commands: Sequence[str]) -> float:
+        """returns the timeout for the request of the commands"""
+        return min(
+            sum(self.command_timeout(model, command) for command in commands),
+            self.max_timeout,
+        )
+
+    def learn(self, model: str, commands: Sequence[str], latency: float):
+        """
+        Records the latency of a successful request.  The latency of a batched
+        request is shared evenly by the commands.
+        """
+        if not self.config.adaptive_timeouts:
+            return
+
+        cmd_latency = latency / len(commands)
+        for command in commands:
+            key = (model, _re_numbers.sub("#", command))
+            if not (stats := self._latency.get(key)):
+                stats = self._latency[key] = _LatencyStats()
+            stats.add(cmd_latency)
+
+    def learn_timeout(self, model: str, commands: Sequence[str]):
+        """
+        Discards the learned latency of the commands of a request that timed
+        out.  The samples do not include the requests that timed out, so the
+        learned p99 of a device that has become slower is too low; the
+        commands use the profile timeout until they are relearned.
+        """
+        for command in commands:
+            self._latency.pop((model, _re_numbers.sub("#", command)), None)
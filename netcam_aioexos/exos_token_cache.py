@@ -0,0 +1,94 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional
+from pathlib import Path
+import json
+import os
+import time
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EXosTokenCache"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class EXosTokenCache:
+    """
+    The EXosTokenCache stores the RESTCONF session tokens on disk so that the
+    tokens can be reused across netcam runs.  There is one file per device
+    host in the cache directory.  A token is only used until its lifetime
+    expires; the lifetime is measured from the time the token was obtained.
+
+    Attributes
+    ----------
+    cache_dir: Path
+        The directory containing the token files.
+
+    lifetime: int
+        The number of seconds a token is considered valid.
+    """
+
+    def __init__(self, cache_dir: Path, lifetime: int):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.lifetime = lifetime
+        self.cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    def _host_file(self, host: str) -> Path:
+        return self.cache_dir / f"{host}.json"
+
+    def get(self, host: str) -> Optional[str]:
+        """
+        Returns the cached token for the host, or None if there is no token or
+        the token has expired.
+        """
+        try:
+            entry = json.loads(self._host_file(host).read_text())
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("expires", 0) <= time.time():
+            return None
+
+        return entry.get("token")
+
+    def set(self, host: str, token: str):
+        """
+        Stores the token for the host.  The file is written atomically and is
+        only readable by the owner since it contains a session credential.
+        """
+        host_file = self._host_file(host)
+        tmp_file = host_file.with_suffix(".tmp")
+        entry = dict(token=token, expires=time.time() + self.lifetime)
+
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as ofile:
+            json.dump(entry, ofile)
+
+        tmp_file.replace(host_file)
+
+    def remove(self, host: str):
+        """Removes the cached token for the host, if any."""
+        self._host_file(host).unlink(missing_ok=True)
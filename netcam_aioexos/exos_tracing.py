@@ -0,0 +1,182 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# This file contains the optional span tracing used by the DUT.  Spans are
+# exported either to a local JSON lines file, or to an OpenTelemetry (OTLP)
+# collector when the opentelemetry packages are installed.  The spans nest by
+# way of context variables, so spans started by concurrent asyncio tasks are
+# children of the span that was current when the task was created.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, Iterator
+from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+import secrets
+import time
+import json
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EXosTracer", "EXosFileTracer", "EXosOtlpTracer", "trace_checks"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class EXosTracer:
+    """
+    The base class of the span tracers.  The `span` method is a context
+    manager that records the span of the code within it.
+    """
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator:
+        yield None
+
+
+@dataclass
+class EXosSpan:
+    """
+    Define a span as recorded by the EXosFileTracer.  The times are in
+    nanoseconds since the epoch.
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: dict = field(default_factory=dict)
+    status: str = "OK"
+    error: Optional[str] = None
+
+
+# the span that is current in the running context; used for span nesting.
+_current_span: ContextVar[Optional[EXosSpan]] = ContextVar(
+    "exos_current_span", default=None
+)
+
+
+class EXosFileTracer(EXosTracer):
+    """
+    This tracer writes each span, when it ends, as one JSON line to a local
+    file.  Spans started without a current span begin a new trace.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path).expanduser()
+        self._ofile = None
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[EXosSpan]:
+        parent = _current_span.get()
+
+        span = EXosSpan(
+            name=name,
+            trace_id=parent.trace_id if parent else secrets.token_hex(16),
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+        )
+
+        ctx_token = _current_span.set(span)
+        try:
+            yield span
+
+        except BaseException as exc:
+            span.status = "ERROR"
+            span.error = repr(exc)
+            raise
+
+        finally:
+            span.end_ns = time.time_ns()
+            _current_span.reset(ctx_token)
+            self._export(span)
+
+    def _export(self, span: EXosSpan):
+        if not self._ofile:
+            self._ofile = self.path.open("a", buffering=1)
+
+        self._ofile.write(json.dumps(asdict(span)) + "\n")
+
+
+class EXosOtlpTracer(EXosTracer):
+    """
+    This tracer uses the OpenTelemetry SDK to export the spans to an OTLP
+    collector.  The opentelemetry-sdk and opentelemetry-exporter-otlp packages
+    are required; they are not dependencies of this plugin.
+    """
+
+    def __init__(self, endpoint: Optional[str] = None):
+        try:
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError as exc:
+            raise RuntimeError(
+                "EXOS plugin OTLP tracing requires the opentelemetry-sdk and "
+                f"opentelemetry-exporter-otlp packages: {str(exc)}"
+            )
+
+        # when the endpoint is not provided, the exporter uses the standard
+        # OTEL_EXPORTER_OTLP_ENDPOINT environment variable.
+
+        self.provider = TracerProvider(
+            resource=Resource.create({"service.name": "netcam-aioexos"})
+        )
+        self.provider.add_span_processor(
+            BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint))
+        )
+        self._tracer = self.provider.get_tracer("netcam_aioexos")
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator:
+        with self._tracer.start_as_current_span(name, attributes=attributes) as span:
+            yield span
+
+
+def trace_checks(executor):
+    """
+    Decorates a check executor so that it runs within an "execute_checks" span.
+    This decorator is used beneath the `execute_checks.register` decorator.
+    """
+
+    @wraps(executor)
+    async def traced_executor(dut, collection):
+        with dut.trace_span(
+            "execute_checks",
+            collection=type(collection).__name__,
+            executor=executor.__name__,
+        ):
+            return await executor(dut, collection)
+
+    return traced_executor
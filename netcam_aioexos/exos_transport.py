@@ -0,0 +1,119 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional
+import ssl
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+import httpx
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .exos_plugin_config import EXosPluginConfig
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["EXosSharedTransport"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class EXosSharedTransport(httpx.AsyncBaseTransport):
+    """
+    The EXosSharedTransport is the HTTP transport shared by the API clients of
+    all DUTs.  There is a single connection pool and a single SSL context for
+    the process rather than one per client.  Connections are keyed by device
+    host in the pool, and kept alive so that the JSON-RPC and RESTCONF clients
+    of the same device reuse them.
+
+    The pool bounds the total number of connections by `max_inflight_total`;
+    it does not bound the connections per host.  The per-host number of
+    connections is bounded by the DUT `max_inflight_per_device` limit, since
+    every DUT API request holds that limit while it is sent.
+
+    Since the transport is shared, the `aclose` called when a DUT client is
+    closed does nothing.  Each DUT calls `acquire` when it is set up and
+    `release` when it is torn down; the connection pool is closed when the last
+    DUT is released.  A new connection pool is created if the transport is used
+    again after it is closed.
+    """
+
+    def __init__(self, config: EXosPluginConfig):
+        # The EXOS devices generally use self-signed certificates, so the
+        # certificate verification is disabled; same as the aio-exos default.
+
+        self._ssl_context = ssl.create_default_context()
+        self._ssl_context.check_hostname = False
+        self._ssl_context.verify_mode = ssl.CERT_NONE
+
+        self._limits = httpx.Limits(
+            max_connections=config.max_inflight_total,
+            max_keepalive_connections=config.max_inflight_total,
+            keepalive_expiry=config.keepalive_expiry,
+        )
+
+        self._transport: Optional[httpx.AsyncHTTPTransport] = None
+        self._users = 0
+
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        """returns the connection pool transport, creating it when needed"""
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport(
+                verify=self._ssl_context, limits=self._limits
+            )
+        return self._transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool().handle_async_request(request)
+
+    def acquire(self) -> None:
+        """registers a DUT that uses the transport"""
+        self._users += 1
+
+    async def release(self) -> bool:
+        """
+        Unregisters a DUT that uses the transport, and closes the connection
+        pool when it was the last DUT.  Returns True when it was the last DUT.
+        """
+        self._users -= 1
+        if self._users != 0:
+            return False
+
+        await self.aclose_shared()
+        return True
+
+    async def aclose(self) -> None:
+        """the shared transport is not closed by the individual DUT clients"""
+        pass
+
+    async def aclose_shared(self) -> None:
+        """closes the shared connection pool"""
+        if self._transport is not None:
+            transport, self._transport = self._transport, None
+            await transport.aclose()
@@ -0,0 +1,22 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# The simulator package provides a local emulation of the EXOS JSON-RPC and
+# RESTCONF endpoints for load and performance testing without real devices.
+# =============================================================================
+
+from .sim_device import SimDevice, SimDeviceSpec
+from .sim_server import SimServer, SimFaults
+from .sim_fleet import SimFleet
@@ -0,0 +1,130 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# Run a fleet of simulated EXOS devices:
+#
+#   python -m netcam_aioexos.simulator --devices 100 --hosts-file sim-hosts.json
+#
+# The hosts file is then used as the plugin `config.hosts_file`, with
+# `config.proto = "http"`.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import resource
+from pathlib import Path
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .sim_device import SimDeviceSpec
+from .sim_server import SimFaults
+from .sim_fleet import SimFleet
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def cli_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="netcam_aioexos.simulator",
+        description="Run simulated EXOS devices for load and performance testing",
+    )
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--base-port", type=int, default=0)
+    parser.add_argument("--hosts-file", type=Path, default=Path("sim-hosts.json"))
+    parser.add_argument("--name-prefix", default="sim-exos")
+
+    parser.add_argument("--slots", type=int, default=1)
+    parser.add_argument("--ports-per-slot", type=int, default=48)
+    parser.add_argument("--vlans", type=int, default=10)
+    parser.add_argument("--svis", type=int, default=2)
+    parser.add_argument("--svis-down", type=int, default=0)
+    parser.add_argument("--lags", type=int, default=2)
+    parser.add_argument("--lag-members", type=int, default=2)
+    parser.add_argument("--lldp-neighbors", type=int, default=4)
+
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--token-reject-rate", type=float, default=0.0)
+
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace):
+    spec = SimDeviceSpec(
+        slots=args.slots,
+        ports_per_slot=args.ports_per_slot,
+        vlans=args.vlans,
+        svis=args.svis,
+        svis_down=args.svis_down,
+        lags=args.lags,
+        lag_members=args.lag_members,
+        lldp_neighbors=args.lldp_neighbors,
+    )
+    faults = SimFaults(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        drop_rate=args.drop_rate,
+        token_reject_rate=args.token_reject_rate,
+    )
+
+    fleet = SimFleet(
+        count=args.devices, spec=spec, faults=faults, name_prefix=args.name_prefix
+    )
+    await fleet.start(host=args.host, base_port=args.base_port)
+
+    args.hosts_file.write_text(json.dumps(fleet.hosts, indent=2))
+    print(f"Running {args.devices} simulated devices; hosts: {args.hosts_file}")
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await fleet.stop()
+        print(f"Total requests: {fleet.request_count}")
+
+
+def main():
+    args = cli_args()
+
+    # each simulated device uses a listening socket, and each DUT connection a
+    # further socket; raise the open file limit as far as allowed.
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,510 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# This file contains the synthetic EXOS device used by the simulator.  The
+# device generates the CLI command results, in the same record format as the
+# EXOS JSON-RPC API, for a configurable topology.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["SimDeviceSpec", "SimDevice"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class SimDeviceSpec:
+    """
+    Define the synthetic topology of a simulated device.
+
+    Attributes
+    ----------
+    slots: int
+        The number of stack slots.  When more than one, the ports are named
+        "<slot>:<port>"; otherwise just "<port>".
+
+    ports_per_slot: int
+        The number of front panel ports per slot.
+
+    vlans: int
+        The number of VLANs, using VLAN IDs starting from 10.  The ports are
+        assigned to the VLANs round-robin as untagged members, and the uplink
+        ports (the last two ports of the first slot) are tagged members of all
+        VLANs.
+
+    svis: int
+        The number of VLANs, from the first, that have an IP address.
+
+    svis_down: int
+        The number of the SVIs, from the last, that are not up.
+
+    lags: int
+        The number of LAGs; each LAG uses `lag_members` ports taken from the
+        end of the last slot.
+
+    lag_members: int
+        The number of member ports per LAG.
+
+    lldp_neighbors: int
+        The number of ports, from the first, that report an LLDP neighbor.
+    """
+
+    slots: int = 1
+    ports_per_slot: int = 48
+    vlans: int = 10
+    svis: int = 2
+    svis_down: int = 0
+    lags: int = 2
+    lag_members: int = 2
+    lldp_neighbors: int = 4
+
+
+@dataclass
+class SimDevice:
+    """
+    The SimDevice generates the EXOS CLI command results for a synthetic
+    device.  The results are the records that the aio-exos `cli` method
+    returns; the simulator server wraps these in the JSON-RPC response.
+    """
+
+    name: str
+    spec: SimDeviceSpec = field(default_factory=SimDeviceSpec)
+
+    # -------------------------------------------------------------------------
+    # synthetic topology
+    # -------------------------------------------------------------------------
+
+    @cached_property
+    def ports(self) -> list[str]:
+        spec = self.spec
+        if spec.slots == 1:
+            return [str(port) for port in range(1, spec.ports_per_slot + 1)]
+
+        return [
+            f"{slot}:{port}"
+            for slot in range(1, spec.slots + 1)
+            for port in range(1, spec.ports_per_slot + 1)
+        ]
+
+    @cached_property
+    def port_list(self) -> str:
+        """the EXOS port-list string, one range per slot"""
+        spec = self.spec
+        if spec.slots == 1:
+            return f"1-{spec.ports_per_slot}"
+
+        return ",".join(
+            f"{slot}:1-{spec.ports_per_slot}" for slot in range(1, spec.slots + 1)
+        )
+
+    @cached_property
+    def uplinks(self) -> list[str]:
+        return self.ports[:2]
+
+    @cached_property
+    def lag_ports(self) -> dict[int, list[str]]:
+        """LAG group-id (the first member port index) to member port names"""
+        spec = self.spec
+        lags = dict()
+        for lag_i in range(spec.lags):
+            end = len(self.ports) - lag_i * spec.lag_members
+            members = self.ports[end - spec.lag_members : end]
+            lags[self.ports.index(members[0]) + 1] = members
+
+        return lags
+
+    @cached_property
+    def vlan_ids(self) -> list[int]:
+        return [10 + vlan_i for vlan_i in range(self.spec.vlans)]
+
+    @cached_property
+    def access_vlan(self) -> dict[str, int]:
+        """port name to untagged VLAN-ID, for the non uplink ports"""
+        if not self.vlan_ids:
+            return dict()
+
+        return {
+            port: self.vlan_ids[port_i % len(self.vlan_ids)]
+            for port_i, port in enumerate(self.ports)
+            if port not in self.uplinks
+        }
+
+    @staticmethod
+    def vlan_name(vlan_id: int) -> str:
+        return f"vlan{vlan_id}"
+
+    @cached_property
+    def vlan_ids_by_name(self) -> dict[str, int]:
+        return {self.vlan_name(vlan_id): vlan_id for vlan_id in self.vlan_ids}
+
+    @cached_property
+    def _vlan_members(self) -> dict[int, list[tuple[str, bool]]]:
+        members = {
+            vlan_id: [(port, True) for port in self.uplinks]
+            for vlan_id in self.vlan_ids
+        }
+        for port, port_vlan in self.access_vlan.items():
+            members[port_vlan].append((port, False))
+
+        return members
+
+    def vlan_members(self, vlan_id: int) -> list[tuple[str, bool]]:
+        """returns the list of (port, is-tagged) members of the VLAN"""
+        return self._vlan_members.get(vlan_id, [])
+
+    # -------------------------------------------------------------------------
+    # command results
+    # -------------------------------------------------------------------------
+
+    def cli(self, command: str) -> Optional[list[dict]]:
+        """
+        Returns the record results for the CLI command, or None if the command
+        is not supported by the simulator.
+        """
+        words = command.split()
+        match words:
+            case ["show", "ports", "information"]:
+                return self.show_ports_information()
+            case ["show", "ports"]:
+                return self.show_ports(self.ports)
+            case ["show", "ports", port_list, "vlan", "port-number"]:
+                return self.show_ports_vlan(port_list)
+            case ["show", "ports", port]:
+                return self.show_ports(port.split(","))
+            case ["show", "vlan"]:
+                return self.show_vlan()
+            case ["show", "vlan", vlan_name]:
+                return self.show_vlan_name(vlan_name)
+            case ["show", "port", "sharing"]:
+                return self.show_port_sharing()
+            case ["show", "lacp"]:
+                return self.show_lacp()
+            case ["show", "lacp", "lag", group_id]:
+                return self.show_lacp_lag(int(group_id))
+            case ["show", "lldp", "neighbors"]:
+                return self.show_lldp_neighbors()
+            case ["show", "port", "transceiver", "information"]:
+                return self.show_port_transceiver_information()
+            case ["show", "ipconfig"]:
+                return self.show_ipconfig()
+            case ["show", "mgmt"] | ["show", "Mgmt"]:
+                return self.show_mgmt()
+            case ["show", "version"]:
+                return self.show_version()
+            case ["show", "switch"]:
+                return self.show_switch()
+
+        return None
+
+    def cli_text(self, command: str) -> Optional[str]:
+        """
+        Returns the CLI text output for the command, or None if the command is
+        not supported by the simulator.
+        """
+        match command.split():
+            case ["show", "version"]:
+                return self.show_version_text()
+            case ["show", "switch"]:
+                return self.show_switch_text()
+
+        return None
+
+    def restconf(self, path: str) -> Optional[dict]:
+        """
+        Returns the RESTCONF data for the path, relative to the RESTCONF data
+        URL, or None if the path is not supported by the simulator.
+        """
+        match path:
+            case "openconfig-platform:components":
+                return self.oc_platform_components()
+
+        return None
+
+    def show_ports_information(self) -> list[dict]:
+        lag_master = {
+            port: members[0] for members in self.lag_ports.values() for port in members
+        }
+        return [
+            {
+                "show_ports_info": {
+                    "port": port,
+                    "portList": self.port_list,
+                    **(
+                        {"ldShareMaster": lag_master[port]}
+                        if port in lag_master
+                        else {}
+                    ),
+                }
+            }
+            for port in self.ports
+        ]
+
+    def show_ports(self, ports: list[str]) -> list[dict]:
+        return [
+            {
+                "show_ports_info_detail": {
+                    "port": port,
+                    "adminState": 1,
+                    "linkState": 1 if port_i % 4 else 0,
+                    "portSpeed": 4,
+                    "descriptionString": f"port {port}",
+                    "displayString": "",
+                }
+            }
+            for port_i, port in enumerate(ports)
+            if port in self.ports
+        ]
+
+    def _expand_port_list(self, port_list: str) -> list[str]:
+        ports = list()
+        for item in port_list.split(","):
+            prefix, _, port_range = item.rpartition(":")
+            start, _, end = port_range.partition("-")
+            for port in range(int(start), int(end or start) + 1):
+                ports.append(f"{prefix}:{port}" if prefix else str(port))
+
+        return ports
+
+    def show_ports_vlan(self, port_list: str) -> list[dict]:
+        records = list()
+        for port in self._expand_port_list(port_list):
+            if port in self.uplinks:
+                records.extend(
+                    {
+                        "show_ports_info_detail_vlans": {
+                            "port": port,
+                            "vlanId": vlan_id,
+                            "tagStatus": 1,
+                        }
+                    }
+                    for vlan_id in self.vlan_ids
+                )
+            elif vlan_id := self.access_vlan.get(port):
+                records.append(
+                    {
+                        "show_ports_info_detail_vlans": {
+                            "port": port,
+                            "vlanId": vlan_id,
+                            "tagStatus": 0,
+                        }
+                    }
+                )
+
+        return records
+
+    def show_vlan(self) -> list[dict]:
+        return [
+            {
+                "vlanProc": {
+                    "tag": vlan_id,
+                    "name1": self.vlan_name(vlan_id),
+                    "adminState": 1,
+                    "linkState": 1,
+                    "activePorts": len(self.vlan_members(vlan_id)),
+                    "ipStatus": 1 if vlan_i < self.spec.svis else 0,
+                    "descriptionString": "",
+                    "portSpeed": 0,
+                }
+            }
+            for vlan_i, vlan_id in enumerate(self.vlan_ids)
+        ]
+
+    def show_vlan_name(self, vlan_name: str) -> list[dict]:
+        if not (vlan_id := self.vlan_ids_by_name.get(vlan_name)):
+            return []
+
+        return [
+            {
+                "vlanProc": {
+                    "name1": vlan_name,
+                    "tag": vlan_id,
+                    "port": port,
+                    "tagStatus": int(tagged),
+                    "linkState": 1,
+                }
+            }
+            for port, tagged in self.vlan_members(vlan_id)
+        ]
+
+    def show_port_sharing(self) -> list[dict]:
+        return [
+            {"ls_ports_show": {"loadShareMaster": members[0], "port": port}}
+            for members in self.lag_ports.values()
+            for port in members
+        ]
+
+    def show_lacp(self) -> list[dict]:
+        return [{"lacpLagCfg": {"group_id": group_id}} for group_id in self.lag_ports]
+
+    def show_lacp_lag(self, group_id: int) -> list[dict]:
+        if not (members := self.lag_ports.get(group_id)):
+            return []
+
+        return [
+            {"lacpLagCfg": {"group_id": group_id, "up": 1, "enable": 1}},
+            *(
+                {"lagMemberPortCfg": {"port_number": port, "actor_state": "ACGSCD"}}
+                for port in members
+            ),
+        ]
+
+    def show_lldp_neighbors(self) -> list[dict]:
+        return [
+            {
+                "lldpPortNbrInfoShort": {
+                    "port": port,
+                    "nbrSysName": f"{self.name}-nei{port_i}",
+                    "nbrPortID": "1",
+                }
+            }
+            for port_i, port in enumerate(self.ports[: self.spec.lldp_neighbors])
+        ]
+
+    def show_port_transceiver_information(self) -> list[dict]:
+        return [
+            {
+                "show_ports_transceiver": {
+                    "port": port,
+                    "partNumber": "10GB-SR-SFPP",
+                    "mediaType": "10GBASE-SR SFP+",
+                    "slNumber": f"SN{port_i:06d}",
+                }
+            }
+            for port_i, port in enumerate(self.ports)
+        ]
+
+    def show_ipconfig(self) -> list[dict]:
+        svis = self.vlan_ids[: self.spec.svis]
+        svis_up = len(svis) - self.spec.svis_down
+
+        # the "U" flag is set when the SVI is up.
+
+        return [
+            {
+                "ifIpConfig": {
+                    "vlan": self.vlan_name(vlan_id),
+                    "ipAddress": f"10.{vlan_id // 256}.{vlan_id % 256}.1",
+                    "prefixLen": 24,
+                    "flags": "EUfIMRv" if svi_i < svis_up else "EfIMRv",
+                }
+            }
+            for svi_i, vlan_id in enumerate(svis)
+        ]
+
+    def show_mgmt(self) -> list[dict]:
+        return [
+            {
+                "vlanProc": {
+                    "name1": "Mgmt",
+                    "ipAddress": "192.168.1.10",
+                    "maskForDisplay": 24,
+                    "adminState": 1,
+                    "linkState": 1,
+                }
+            }
+        ]
+
+    @cached_property
+    def boards(self) -> list[tuple[str, str]]:
+        """the (board, serial number) of the switch, or of each stack slot"""
+        if self.spec.slots == 1:
+            return [("Switch", "1915N-43095")]
+
+        return [
+            (f"Slot-{slot}", f"1915N-4309{slot}")
+            for slot in range(1, self.spec.slots + 1)
+        ]
+
+    def show_version(self) -> list[dict]:
+        return [
+            {
+                "show_version": {
+                    "board": board,
+                    "partNumber": "800745-00-06",
+                    "serialNumber": serial,
+                    "imageVersion": "31.7.1.4",
+                }
+            }
+            for board, serial in self.boards
+        ]
+
+    def oc_platform_components(self) -> dict:
+        """
+        Returns the openconfig platform components; the chassis, and a
+        component per stack slot.
+        """
+        is_stack = self.spec.slots > 1
+        system_type = "X465-48T-SwitchStack" if is_stack else "X465-48T"
+
+        chassis = dict(
+            name="Chassis",
+            type="openconfig-platform-types:CHASSIS",
+            description=system_type,
+            **{
+                "serial-no": self.boards[0][1],
+                "part-no": "800745-00-06",
+                "software-version": "31.7.1.4",
+            },
+        )
+
+        slots = [
+            dict(
+                name=board,
+                type="openconfig-platform-types:LINECARD",
+                description="X465-48T",
+                **{
+                    "serial-no": serial,
+                    "part-no": "800745-00-06",
+                    "software-version": "31.7.1.4",
+                },
+            )
+            for board, serial in (self.boards if is_stack else [])
+        ]
+
+        return {
+            "openconfig-platform:components": {
+                "component": [
+                    dict(name=state["name"], state=state) for state in [chassis, *slots]
+                ]
+            }
+        }
+
+    def show_switch(self) -> list[dict]:
+        return [{"show_switch": {"sysName": self.name, "sysType": "X465-48T"}}]
+
+    def show_version_text(self) -> str:
+        return "".join(
+            f"{board:<12}: 800745-00-06 {serial} Rev 6.0 BootROM: 3.4.2.2"
+            "    IMG: 31.7.1.4\n"
+            for board, serial in self.boards
+        )
+
+    def show_switch_text(self) -> str:
+        return f"SysName:          {self.name}\nSystem Type:      X465-48T\n"
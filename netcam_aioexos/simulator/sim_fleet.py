@@ -0,0 +1,88 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional
+import asyncio
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .sim_device import SimDevice, SimDeviceSpec
+from .sim_server import SimServer, SimFaults
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["SimFleet"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class SimFleet:
+    """
+    The SimFleet runs a simulator server for each of a number of simulated
+    devices, each on its own port.  The `hosts` mapping of device name to
+    "host:port" is used as the plugin `hosts_file` content so that the DUTs
+    connect to the simulated devices.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        spec: Optional[SimDeviceSpec] = None,
+        faults: Optional[SimFaults] = None,
+        name_prefix: str = "sim-exos",
+    ):
+        spec = spec or SimDeviceSpec()
+        self.servers = [
+            SimServer(SimDevice(name=f"{name_prefix}{dev_i:05d}", spec=spec), faults)
+            for dev_i in range(1, count + 1)
+        ]
+        self.hosts: dict[str, str] = dict()
+
+    async def start(self, host: str = "127.0.0.1", base_port: int = 0):
+        """
+        Starts all the servers.  When `base_port` is 0 each server uses any
+        available port; otherwise the servers use consecutive ports from
+        `base_port`.
+        """
+        ports = await asyncio.gather(
+            *(
+                server.start(host=host, port=base_port + dev_i if base_port else 0)
+                for dev_i, server in enumerate(self.servers)
+            )
+        )
+        self.hosts = {
+            server.device.name: f"{host}:{port}"
+            for server, port in zip(self.servers, ports)
+        }
+
+    async def stop(self):
+        """Stops all the servers."""
+        await asyncio.gather(*(server.stop() for server in self.servers))
+
+    @property
+    def request_count(self) -> int:
+        """the total number of requests received by all the servers"""
+        return sum(server.request_count for server in self.servers)
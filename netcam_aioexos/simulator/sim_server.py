@@ -0,0 +1,283 @@
+#  Copyright 2021 Jeremy Schulman
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+# =============================================================================
+# This file contains the simulator HTTP server.  The server emulates the EXOS
+# JSON-RPC and RESTCONF endpoints for one SimDevice.  The server is a
+# minimal HTTP/1.1 implementation using asyncio streams so that thousands of
+# simulated devices can be run in a single process.
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional
+from dataclasses import dataclass
+import asyncio
+import random
+import json
+import secrets
+from urllib.parse import unquote
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from .sim_device import SimDevice
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["SimFaults", "SimServer"]
+
+# -----------------------------------------------------------------------------
+#
+#                                 CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class SimFaults:
+    """
+    Define the faults injected by the simulator server.
+
+    Attributes
+    ----------
+    latency: float
+        The number of seconds added to each response.
+
+    jitter: float
+        The maximum number of random seconds added to the latency.
+
+    error_rate: float
+        The probability, 0.0 to 1.0, that a request fails with an HTTP
+        `error_status` response.
+
+    error_status: int
+        The HTTP status code of the injected errors; by default 503, which
+        the DUT retries.
+
+    drop_rate: float
+        The probability, 0.0 to 1.0, that a request is dropped by closing the
+        connection without a response.
+
+    token_reject_rate: float
+        The probability, 0.0 to 1.0, that a RESTCONF data request rejects the
+        session token with an HTTP 401 response; the token is then no longer
+        valid, so the client must log in again.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    drop_rate: float = 0.0
+    token_reject_rate: float = 0.0
+
+
+# the RESTCONF data URL path prefix
+RESTCONF_DATA = "/rest/restconf/data/"
+
+
+class SimServer:
+    """
+    The SimServer serves the EXOS API endpoints for one simulated device:
+
+        POST /jsonrpc                - the JSON-RPC "cli" method
+        POST /auth/token/            - the RESTCONF login
+        GET  /rest/restconf/data/... - the RESTCONF data; see SimDevice
+                                       `restconf` for the supported paths
+
+    The JSON-RPC request may contain several semi-colon separated commands, in
+    which case the result is the list of per-command results; same as EXOS.
+
+    The RESTCONF data requests must use a session token issued by the login,
+    otherwise the response is HTTP 401; for example a token cached by a prior
+    run of the simulator.
+
+    Attributes
+    ----------
+    device: SimDevice
+        The simulated device.
+
+    faults: SimFaults
+        The faults injected into the responses.
+
+    request_count: int
+        The number of requests received.
+    """
+
+    def __init__(self, device: SimDevice, faults: Optional[SimFaults] = None):
+        self.device = device
+        self.faults = faults or SimFaults()
+        self.request_count = 0
+        self._server: Optional[asyncio.Server] = None
+        self._tokens: set[str] = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """
+        Starts the server listening on the host and port; a port of 0 selects
+        any available port.  Returns the listening port number.
+        """
+        self._server = await asyncio.start_server(self._handle_conn, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stops the server."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    # -------------------------------------------------------------------------
+    # HTTP handling
+    # -------------------------------------------------------------------------
+
+    async def _handle_conn(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        try:
+            while request := await self._read_request(reader):
+                method, path, headers, body = request
+                self.request_count += 1
+
+                faults = self.faults
+                if delay := faults.latency + random.uniform(0, faults.jitter):
+                    await asyncio.sleep(delay)
+
+                if random.random() < faults.drop_rate:
+                    break
+
+                if random.random() < faults.error_rate:
+                    status, payload = faults.error_status, {"error": "simulated error"}
+                else:
+                    status, payload = self._route(method, path, headers, body)
+
+                self._write_response(writer, status, payload)
+                await writer.drain()
+
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(
+        reader: asyncio.StreamReader,
+    ) -> Optional[tuple[str, str, dict[str, str], bytes]]:
+        """
+        returns the (method, path, headers, body) of the next request, or None;
+        the header names are lower case.
+        """
+        if not (request_line := await reader.readline()):
+            return None
+
+        method, path, _ = request_line.decode().split(" ", 2)
+
+        headers = dict()
+        while (header := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = header.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        content_length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(content_length) if content_length else b""
+        return method, path, headers, body
+
+    def _write_response(self, writer: asyncio.StreamWriter, status: int, payload):
+        body = json.dumps(payload).encode()
+        reason = {
+            200: "OK",
+            401: "Unauthorized",
+            404: "Not Found",
+            500: "Internal Server Error",
+            502: "Bad Gateway",
+            503: "Service Unavailable",
+            504: "Gateway Timeout",
+        }
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {reason.get(status, 'Error')}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Set-Cookie: session={secrets.token_hex(8)}; Path=/\r\n"
+                "\r\n"
+            ).encode()
+            + body
+        )
+
+    # -------------------------------------------------------------------------
+    # API endpoints
+    # -------------------------------------------------------------------------
+
+    def _route(
+        self, method: str, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict]:
+        path = unquote(path.partition("?")[0]).rstrip("/")
+
+        match method, path:
+            case "POST", "/jsonrpc":
+                return 200, self._jsonrpc(json.loads(body))
+            case "POST", "/auth/token":
+                token = secrets.token_hex(16)
+                self._tokens.add(token)
+                return 200, {"token": token}
+            case "GET", _ if path.startswith(RESTCONF_DATA):
+                return self._restconf(path.removeprefix(RESTCONF_DATA), headers)
+
+        return 404, {"error": f"not found: {path}"}
+
+    def _restconf(self, path: str, headers: dict[str, str]) -> tuple[int, dict]:
+        """returns the response to a RESTCONF data GET request"""
+        cookies = dict(
+            cookie.strip().partition("=")[::2]
+            for cookie in headers.get("cookie", "").split(";")
+        )
+
+        if (token := cookies.get("x-auth-token")) not in self._tokens:
+            return 401, {"error": "invalid token"}
+
+        if random.random() < self.faults.token_reject_rate:
+            self._tokens.discard(token)
+            return 401, {"error": "token expired"}
+
+        if (data := self.device.restconf(path)) is None:
+            return 404, {"error": f"not found: {path}"}
+
+        return 200, data
+
+    def _jsonrpc(self, jreq: dict) -> dict:
+        commands = [cmd.strip() for cmd in jreq["params"][0].split(";")]
+        results = [self._cli_result(command) for command in commands]
+
+        return {
+            "jsonrpc": "2.0",
+            "id": jreq.get("id"),
+            "result": results[0] if len(results) == 1 else results,
+        }
+
+    def _cli_result(self, command: str) -> list:
+        """
+        Returns the EXOS result for one command; the first item is the CLI
+        text output followed by the data records.
+        """
+        cli_text = self.device.cli_text(command)
+        records = self.device.cli(command)
+
+        if cli_text is None and records is None:
+            return [{"CLIoutput": f"Error: Invalid input detected: {command}\n"}]
+
+        return [{"CLIoutput": cli_text or ""}, *(records or [])]
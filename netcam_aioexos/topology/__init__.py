@@ -1,6 +1,66 @@
-from . import exos_check_device_info
-from . import exos_check_cabling
-from . import exos_check_transceivers
-from . import exos_check_ipaddrs
-from . import exos_check_interfaces
-from . import exos_check_lags
+# -----------------------------------------------------------------------------
+# The check executor modules are not imported here.  Each check executor is
+# registered with an import-time stub that imports the module, and its
+# dependencies, on first dispatch; see the DUT `register_lazy` method.  The
+# DUT data used by each check executor is declared here for the DUT prefetch.
+# -----------------------------------------------------------------------------
+
+from netcad.feats.topology.checks.check_device_info import (
+    DeviceInformationCheckCollection,
+)
+from netcad.feats.topology.checks.check_cabling_nei import (
+    InterfaceCablingCheckCollection,
+)
+from netcad.feats.topology.checks.check_transceivers import (
+    TransceiverCheckCollection,
+)
+from netcad.feats.topology.checks.check_ipaddrs import IPInterfacesCheckCollection
+from netcad.feats.topology.checks.check_interfaces import InterfaceCheckCollection
+from netcad.feats.topology.checks.check_lags import LagCheckCollection
+
+from netcam_aioexos.exos_dut import EXOSDeviceUnderTest
+
+# the check collection type, module, check executor, and prefetch accessors.
+
+_check_executors = [
+    (
+        DeviceInformationCheckCollection,
+        "exos_check_device_info",
+        "exos_check_device_info",
+        ("get_system_info",),
+    ),
+    (
+        InterfaceCablingCheckCollection,
+        "exos_check_cabling",
+        "exos_check_cabling",
+        ("get_lldp_neighbors",),
+    ),
+    (
+        TransceiverCheckCollection,
+        "exos_check_transceivers",
+        "exos_check_transceivers",
+        ("get_xcvr_info",),
+    ),
+    (
+        IPInterfacesCheckCollection,
+        "exos_check_ipaddrs",
+        "exos_test_ipaddrs",
+        ("get_ipconfig", "get_mgmt"),
+    ),
+    (
+        InterfaceCheckCollection,
+        "exos_check_interfaces",
+        "exos_check_interfaces",
+        ("get_ports_info", "get_ports", "get_vlans", "get_mgmt", "get_lacp_snapshot"),
+    ),
+    (
+        LagCheckCollection,
+        "exos_check_lags",
+        "exos_check_lags",
+        ("get_lacp_snapshot",),
+    ),
+]
+
+for _c_type, _module, _executor, _prefetch in _check_executors:
+    EXOSDeviceUnderTest.register_lazy(_c_type, f"{__name__}.{_module}", _executor)
+    EXOSDeviceUnderTest.prefetch_register(_c_type, *_prefetch)
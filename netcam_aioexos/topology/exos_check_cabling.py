@@ -35,6 +35,7 @@ from netcad.checks import CheckResultsCollection, CheckStatus
 # -----------------------------------------------------------------------------
 
 from netcam_aioexos.exos_dut import EXOSDeviceUnderTest
+from netcam_aioexos.exos_tracing import trace_checks
 
 
 # -----------------------------------------------------------------------------
@@ -51,6 +52,7 @@ __all__ = []
 
 
 @EXOSDeviceUnderTest.execute_checks.register  # noqa
+@trace_checks
 async def exos_check_cabling(
     self, testcases: InterfaceCablingCheckCollection
 ) -> CheckResultsCollection:
@@ -70,7 +72,7 @@ async def exos_check_cabling(
     device = dut.device
     results = list()
 
-    cli_lldp_rsp = await dut.exos_jrpc.cli("show lldp neighbors")
+    cli_lldp_rsp = await dut.get_lldp_neighbors()
 
     # create a map of local interface name to the LLDP neighbor record.
 
@@ -12,6 +12,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from functools import cache
+
 # -----------------------------------------------------------------------------
 # Public Impors
 # -----------------------------------------------------------------------------
@@ -28,6 +34,8 @@ from netcad.feats.topology.checks.check_device_info import (
 # -----------------------------------------------------------------------------
 
 from netcam_aioexos.exos_dut import EXOSDeviceUnderTest
+from netcam_aioexos.exos_system_info import system_info_from_versions
+from netcam_aioexos.exos_tracing import trace_checks
 
 # -----------------------------------------------------------------------------
 # Exports (None)
@@ -42,10 +50,10 @@ from netcam_aioexos.exos_dut import EXOSDeviceUnderTest
 
 show_version_template = """
 <group name="sw_ver_switch">
-Switch          : {{ ignore(".*") }} IMG: {{ sw_ver }}
+Switch          : {{ part_no }} {{ serial }} {{ ignore(".*") }} IMG: {{ sw_ver }}
 </group>
 <group name="sw_ver_stack">
-Slot-{{ slot_id }} : {{ ignore(".*") }} IMG: {{ sw_ver }}
+Slot-{{ slot_id }} : {{ part_no }} {{ serial }} {{ ignore(".*") }} IMG: {{ sw_ver }}
 </group>
 """
 # SysName:          {{ hostname }}
@@ -56,7 +64,36 @@ System Type:      {{ product_model | _line_ }}
 """
 
 
+@cache
+def ttp_parser(template: str) -> ttp:
+    """
+    Returns the TTP parser for the template.  The parser is created once, per
+    template, since creating the parser compiles the template.
+    """
+    return ttp(template=template)
+
+
+def ttp_parse(data: str, template: str) -> list:
+    """
+    Parses the CLI text output using the cached TTP parser for the template,
+    and returns the TTP results.  The parser input and results are cleared so
+    that the parser is ready for the next call; there is no await between the
+    calls, so the parser is not shared by concurrent check executors.  The
+    per-template results are copied since clearing the parser results
+    empties the lists returned by the parser.
+    """
+    parser = ttp_parser(template)
+    parser.add_input(data)
+    try:
+        parser.parse()
+        return [list(t_results) for t_results in parser.result()]
+    finally:
+        parser.clear_input()
+        parser.clear_result()
+
+
 @EXOSDeviceUnderTest.execute_checks.register  # noqa
+@trace_checks
 async def exos_check_device_info(
     self, device_checks: DeviceInformationCheckCollection
 ) -> CheckResultsCollection:
@@ -64,34 +101,32 @@ async def exos_check_device_info(
     This function is used to collect device information from the Extreme EXOS.
     The primary check is the product-model.  Additional information is
     collected and returned as an informational check. This includes the
-    hostname, serial number, part number, and software version.
+    hostname, serial number, software version, and the per-slot part number,
+    serial number, and software version of a stack.
     """
     dut: EXOSDeviceUnderTest = self
 
     # -------------------------------------------------------------------------
-    # get the software version
+    # the system information is from the structured data selected by the
+    # `device_info_source` plugin config.  The CLI text output of "show switch"
+    # and "show version" is only used for the values that are not found in
+    # that data.
     # -------------------------------------------------------------------------
 
-    cli_sh_ver = await dut.exos_jrpc.cli("show version", text=True)
-    sh_ver_ttp = ttp(data=cli_sh_ver[0], template=show_version_template)
-    sh_ver_ttp.parse()
-    sh_ver_data = sh_ver_ttp.result()[0][0]
-    sh_ver_data = sh_ver_data.get("sw_ver_stack") or sh_ver_data.get("sw_ver_switch")
+    sys_info = dict(await dut.get_system_info() or {})
 
-    # -------------------------------------------------------------------------
-    # get the switch information
-    # -------------------------------------------------------------------------
+    if not (sys_info.get("product_model") and sys_info.get("hostname")):
+        _update_missing(sys_info, await _switch_from_cli_text(dut))
+
+    # the serial number and software versions are replaced together so that
+    # the per-slot values are from the same output.
 
-    cli_sh_switch = await dut.exos_jrpc.cli("show switch", text=True)
-    sh_sw_ttp = ttp(data=cli_sh_switch[0], template=show_switch_template)
-    sh_sw_ttp.parse()
-    sh_sw_data = sh_sw_ttp.result()[0][0]
-    product_model = sh_sw_data["product_model"]
-    hostname = sh_sw_data["hostname"]
+    if not (sys_info.get("software_version") and sys_info.get("serial")):
+        sys_info.update(await _version_from_cli_text(dut))
 
     # store the results.
     check = device_checks.checks[0]
-    has_product_model = product_model
+    has_product_model = sys_info["product_model"]
 
     return [
         # product model check
@@ -108,8 +143,58 @@ async def exos_check_device_info(
             check=check,
             status=CheckStatus.INFO,
             measurement=dict(
-                hostname=hostname,
-                software_version=sh_ver_data,
+                hostname=sys_info["hostname"],
+                serial=sys_info["serial"],
+                software_version=sys_info["software_version"],
+                slots=sys_info["slots"],
             ),
         ),
     ]
+
+
+def _update_missing(sys_info: dict, cli_info: dict):
+    """sets the system information values that are missing from the CLI values"""
+    for key, value in cli_info.items():
+        if not sys_info.get(key):
+            sys_info[key] = value
+
+
+async def _switch_from_cli_text(dut: EXOSDeviceUnderTest) -> dict:
+    """
+    Returns the product model and hostname parsed from the CLI text output of
+    "show switch".
+    """
+    cli_sh_switch = await dut.get_switch_text()
+    sh_sw_data = ttp_parse(cli_sh_switch, show_switch_template)[0][0]
+    return dict(
+        product_model=sh_sw_data.get("product_model"),
+        hostname=sh_sw_data.get("hostname"),
+    )
+
+
+async def _version_from_cli_text(dut: EXOSDeviceUnderTest) -> dict:
+    """
+    Returns the serial number and software version information parsed from
+    the CLI text output of "show version"; see `system_info_from_versions`.
+    """
+    cli_sh_ver = await dut.get_version_text()
+    sh_ver_data = ttp_parse(cli_sh_ver, show_version_template)[0][0]
+
+    # TTP returns a dict, rather than a list, when a group has one match.
+
+    switch = sh_ver_data.get("sw_ver_switch")
+    slots = sh_ver_data.get("sw_ver_stack") or []
+    if isinstance(slots, dict):
+        slots = [slots]
+
+    return system_info_from_versions(
+        [
+            dict(
+                slot_id=version.get("slot_id"),
+                part_no=version.get("part_no"),
+                serial=version.get("serial"),
+                sw_ver=version.get("sw_ver"),
+            )
+            for version in (slots or ([switch] if switch else []))
+        ]
+    )
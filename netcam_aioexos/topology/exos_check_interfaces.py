@@ -17,6 +17,7 @@
 # -----------------------------------------------------------------------------
 
 from typing import Set
+from itertools import chain
 
 # -----------------------------------------------------------------------------
 # Public Imports
@@ -40,6 +41,7 @@ from netcad.feats.topology.checks.check_interfaces import (
 # -----------------------------------------------------------------------------
 
 from ..exos_dut import EXOSDeviceUnderTest
+from ..exos_tracing import trace_checks
 
 
 # -----------------------------------------------------------------------------
@@ -50,6 +52,7 @@ from ..exos_dut import EXOSDeviceUnderTest
 
 
 @EXOSDeviceUnderTest.execute_checks.register  # noqa
+@trace_checks
 async def exos_check_interfaces(
     self, collection: InterfaceCheckCollection
 ) -> CheckResultsCollection:
@@ -86,8 +89,12 @@ async def exos_check_interfaces(
     # complete list of all ports, and then find any missing ports.
     # -------------------------------------------------------------------------
 
-    cli_sh_ports_info = await dut.exos_jrpc.cli("show ports information")
-    cli_sh_ports = await dut.exos_jrpc.cli("show ports")
+    cli_sh_ports_info = await dut.get_ports_info()
+
+    # copy the "show ports" results since the list is extended below with any
+    # missing ports, and the cached results are shared with other executors.
+
+    cli_sh_ports = list(await dut.get_ports())
 
     ports_info_found = set(
         str(if_data["port"])
@@ -101,10 +108,14 @@ async def exos_check_interfaces(
         if (if_data := rec.get("show_ports_info_detail"))
     )
 
+    # fetch any missing ports using batched requests rather than one request
+    # per port.
+
     if missing_interfaces := ports_info_found - ports_data_found:
-        for if_name in missing_interfaces:
-            cli_sh_port = await dut.exos_jrpc.cli(f"show ports {if_name}")
-            cli_sh_ports.extend(cli_sh_port)
+        cli_sh_missing = await dut.cli_batch(
+            [f"show ports {if_name}" for if_name in sorted(missing_interfaces)]
+        )
+        cli_sh_ports.extend(chain.from_iterable(cli_sh_missing))
 
     dev_if_msrds = dict()
     for if_rec in cli_sh_ports:
@@ -126,7 +137,7 @@ async def exos_check_interfaces(
     # output.
     # -------------------------------------------------------------------------
 
-    cli_sh_vlans = await dut.exos_jrpc.cli("show vlan")
+    cli_sh_vlans = await dut.get_vlans()
     for vlan_rec in cli_sh_vlans:
         if not (vlan_msrd_data := vlan_rec.get("vlanProc")):
             continue
@@ -138,6 +149,18 @@ async def exos_check_interfaces(
         if_name = vlan_msrd_data["name1"]
         dev_if_msrds[if_name] = vlan_msrd_data
 
+    # -------------------------------------------------------------------------
+    # if there are any LAG interface checks, then use the DUT LACP snapshot
+    # that is shared with the LAG check executor.  The LAG interfaces are
+    # identified by name, "lag" + group_id, since that is how the snapshot is
+    # keyed; see the DUT `get_lacp_snapshot` method.
+    # -------------------------------------------------------------------------
+
+    lacp_by_group = dict()
+
+    if any(check.check_id().startswith("lag") for check in collection.checks):
+        lacp_by_group = await dut.get_lacp_snapshot()
+
     # -------------------------------------------------------------------------
     # Check each interface for health checks
     # -------------------------------------------------------------------------
@@ -156,10 +179,10 @@ async def exos_check_interfaces(
             continue
 
         if if_name.startswith("lag"):
-            await _check_one_lag_interface(
-                dut,
+            _check_one_lag_interface(
                 device=device,
                 check=check,
+                lag_status=lacp_by_group.get(if_name),
                 results=results,
             )
             dev_if_msrds[if_name] = True
@@ -338,19 +361,26 @@ def _check_one_interface(
     return
 
 
-async def _check_one_lag_interface(
-    dut: EXOSDeviceUnderTest,
+def _check_one_lag_interface(
     device: Device,
     check: InterfaceCheck,
+    lag_status: dict | None,
     results: CheckResultsCollection,
 ):
-    if_name = check.check_id()
-    lag_id = if_name.split("lag")[-1]
+    """
+    Validates a LAG interface using the LACP status from the DUT LACP
+    snapshot.
+    """
+    result = InterfaceCheckResult(device=device, check=check)
 
-    cli_rsp = await dut.exos_jrpc.cli(f"show lacp lag {lag_id}")
+    # if the LAG does not exist, then no further checking.
 
-    result = InterfaceCheckResult(device=device, check=check)
-    lacp_cfg = cli_rsp[0]["lacpLagCfg"]
+    if not lag_status:
+        result.measurement = None
+        results.append(result.measure())
+        return
+
+    lacp_cfg = lag_status["lacp"][0]["lacpLagCfg"]
     msrd = result.measurement
     msrd.desc = check.expected_results.desc  # don't care about the description
     msrd.oper_up = lacp_cfg["up"] == 1
@@ -365,7 +395,7 @@ async def _check_mgmt_interface(
     check: InterfaceCheck,
     results: CheckResultsCollection,
 ):
-    cli_rsp = await dut.exos_jrpc.cli("show mgmt")
+    cli_rsp = await dut.get_mgmt()
     result = InterfaceCheckResult(device=device, check=check)
     mgmt_data = cli_rsp[0]["vlanProc"]
     msrd = result.measurement
@@ -39,6 +39,7 @@ from netcad.checks import CheckResultsCollection, CheckStatus, CheckResult
 # -----------------------------------------------------------------------------
 
 from netcam_aioexos.exos_dut import EXOSDeviceUnderTest
+from netcam_aioexos.exos_tracing import trace_checks
 
 
 # -----------------------------------------------------------------------------
@@ -56,6 +57,7 @@ __all__ = []
 
 
 @EXOSDeviceUnderTest.execute_checks.register  # noqa
+@trace_checks
 async def exos_test_ipaddrs(
     dut, collection: IPInterfacesCheckCollection
 ) -> CheckResultsCollection:
@@ -72,8 +74,8 @@ async def exos_test_ipaddrs(
     # specific record entries "ifIpConfig" as other data is mixed into this CLI
     # response.
 
-    cli_ipcfg_rsp = await dut.exos_jrpc.cli("show ipconfig")
-    cli_mgmt_rsp = await dut.exos_jrpc.cli("show Mgmt")
+    cli_ipcfg_rsp = await dut.get_ipconfig()
+    cli_mgmt_rsp = await dut.get_mgmt()
     msrd_mgmt_data = cli_mgmt_rsp[0]["vlanProc"]
 
     dev_ipcfgs = [
@@ -223,9 +225,7 @@ async def _check_one_interface(
     # check to see if the interface is disabled before we check to see if the IP
     # address is in the up condition.
 
-    dut_interfaces = dut.device_info["interfaces"]
-    dut_iface = dut_interfaces[if_name]
-    iface_enabled = dut_iface["enabled"] is True
+    iface_enabled = if_name not in dut.if_roles.disabled
 
     # if "U" is set in the flags, then it means the interface is Up.
     msrd.oper_up = "U" in msrd_data["flags"]
@@ -300,27 +300,27 @@ async def _check_vlan_assoc_interface(
     interfaces.
     """
 
-    cli_res = await dut.exos_jrpc.cli(f"show vlan {if_name}")
+    # only the SVI VLAN is needed, so do not build the DUT VLAN membership
+    # index; that requires a command for every VLAN on the device.
+
+    cli_res = await dut.get_vlan(if_name)
 
     # store the port and the link-state (bool)
     vlan_if_ports = dict()
     for rec in cli_res:
         if not (vlan_proc := rec.get("vlanProc")):
             continue
-        port = vlan_proc["port"]
+        port = str(vlan_proc["port"])
         if_up = vlan_proc["linkState"] == 1  # 0=down, 1=up
         vlan_if_ports[port] = if_up
 
-    dut_ifs = dut.device_info["interfaces"]
+    if_roles = dut.if_roles
 
     # set of disregarded interfaces based on design.
     disrd_ifnames = set()
 
     for check_ifname in vlan_if_ports:
-        dut_iface = dut_ifs[check_ifname]
-        if (dut_iface["enabled"] is False) or (
-            "is_reserved" in dut_iface["profile_flags"]
-        ):
+        if (check_ifname in if_roles.disabled) or (check_ifname in if_roles.reserved):
             disrd_ifnames.add(check_ifname)
 
     if disrd_ifnames == set(vlan_if_ports):
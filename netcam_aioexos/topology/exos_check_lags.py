@@ -16,7 +16,6 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-import asyncio
 from collections import defaultdict
 
 # -----------------------------------------------------------------------------
@@ -38,6 +37,7 @@ from netcad.checks import CheckResultsCollection
 # -----------------------------------------------------------------------------
 
 from ..exos_dut import EXOSDeviceUnderTest
+from ..exos_tracing import trace_checks
 
 
 # -----------------------------------------------------------------------------
@@ -46,6 +46,7 @@ from ..exos_dut import EXOSDeviceUnderTest
 
 
 @EXOSDeviceUnderTest.execute_checks.register  # noqa
+@trace_checks
 async def exos_check_lags(
     self, testcases: LagCheckCollection
 ) -> CheckResultsCollection:
@@ -61,37 +62,7 @@ async def exos_check_lags(
     # Get the LACP status from the device
     # -------------------------------------------------------------------------
 
-    cli_lacp_resp = await dut.exos_jrpc.cli("show lacp")
-
-    lacp_ports = [
-        lacp_port for rec in cli_lacp_resp if (lacp_port := rec.get("lacpLagCfg"))
-    ]
-    lacp_group_ids = [lacp["group_id"] for lacp in lacp_ports]
-
-    lacp_group_details = await asyncio.gather(
-        *(
-            dut.exos_jrpc.cli("show lacp lag {port_id}".format(port_id=port_id))
-            for port_id in lacp_group_ids
-        )
-    )
-
-    lacp_by_group = defaultdict(dict)
-
-    # NOTE: This code **ASSUMES** the designer is using the convention where
-    # the name of the lag interface is "lag" + the group_id.  This mechanism is
-    # employed because the LACP group_id values are overlapping with actual
-    # port ID numbers.
-
-    for lacp_member_info in lacp_group_details:
-        lacp_port = lacp_member_info[0]["lacpLagCfg"]["group_id"]
-        lacp_port_cfg = [
-            port_cfg
-            for rec in lacp_member_info
-            if (port_cfg := rec.get("lagMemberPortCfg"))
-        ]
-        if_name = "lag" + str(lacp_port)
-        lacp_by_group[if_name]["lacp"] = lacp_member_info
-        lacp_by_group[if_name]["interfaces"] = lacp_port_cfg
+    lacp_by_group = await dut.get_lacp_snapshot()
 
     # -------------------------------------------------------------------------
 
@@ -38,6 +38,7 @@ from netcad.device import Device, DeviceInterface
 # -----------------------------------------------------------------------------
 
 from netcam_aioexos.exos_dut import EXOSDeviceUnderTest
+from netcam_aioexos.exos_tracing import trace_checks
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -54,6 +55,7 @@ __all__ = ["exos_check_transceivers"]
 
 
 @EXOSDeviceUnderTest.execute_checks.register  # noqa
+@trace_checks
 async def exos_check_transceivers(
     dut, check_collection: TransceiverCheckCollection
 ) -> CheckResultsCollection:
@@ -74,7 +76,7 @@ async def exos_check_transceivers(
     # retrieve the port transceiver information and create a mapping by
     # interface port value.
 
-    cli_xcvrinv_resp_data = await dut.exos_jrpc.cli("show port transceiver information")
+    cli_xcvrinv_resp_data = await dut.get_xcvr_info()
     dev_xcvr_ifstatus = {}
     for xcvr_rec in cli_xcvrinv_resp_data:
         data = xcvr_rec["show_ports_transceiver"]
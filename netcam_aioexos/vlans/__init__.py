@@ -12,5 +12,34 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from . import exos_check_vlans
-from . import exos_check_switchports
+# -----------------------------------------------------------------------------
+# The check executor modules are not imported here.  Each check executor is
+# registered with an import-time stub that imports the module on first
+# dispatch; see the DUT `register_lazy` method.
+# -----------------------------------------------------------------------------
+
+from netcad.feats.vlans.checks.check_vlans import VlanCheckCollection
+from netcad.feats.vlans.checks.check_switchports import SwitchportCheckCollection
+
+from netcam_aioexos.exos_dut import EXOSDeviceUnderTest
+
+# the check collection type, module, check executor, and prefetch accessors.
+
+_check_executors = [
+    (
+        VlanCheckCollection,
+        "exos_check_vlans",
+        "eos_check_vlans",
+        ("get_vlans", "get_port_sharing", "get_vlan_members"),
+    ),
+    (
+        SwitchportCheckCollection,
+        "exos_check_switchports",
+        "exos_check_switchports",
+        ("get_ports_info",),
+    ),
+]
+
+for _c_type, _module, _executor, _prefetch in _check_executors:
+    EXOSDeviceUnderTest.register_lazy(_c_type, f"{__name__}.{_module}", _executor)
+    EXOSDeviceUnderTest.prefetch_register(_c_type, *_prefetch)
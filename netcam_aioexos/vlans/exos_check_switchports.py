@@ -37,6 +37,7 @@ from netcad.feats.vlans.checks.check_switchports import (
 # -----------------------------------------------------------------------------
 
 from ..exos_dut import EXOSDeviceUnderTest
+from ..exos_tracing import trace_checks
 
 # -----------------------------------------------------------------------------
 #
@@ -46,6 +47,7 @@ from ..exos_dut import EXOSDeviceUnderTest
 
 
 @EXOSDeviceUnderTest.execute_checks.register  # noqa
+@trace_checks
 async def exos_check_switchports(
     dut, switchport_checks: SwitchportCheckCollection
 ) -> CheckResultsCollection:
@@ -87,14 +89,11 @@ async def exos_check_switchports(
     # lists.  Then from that list going to gather the VLAN information for each
     # port list.  Ugh.
 
-    cli_rsp = await dut.exos_jrpc.cli("show ports information")
+    cli_rsp = await dut.get_ports_info()
     port_lists = cli_rsp[0]["show_ports_info"]["portList"].split(",")
 
     resp = await asyncio.gather(
-        *(
-            dut.exos_jrpc.cli(f"show ports {port_list} vlan port-number")
-            for port_list in port_lists
-        )
+        *(dut.get_port_vlans(port_list) for port_list in port_lists)
     )
 
     for rec in chain.from_iterable(resp):
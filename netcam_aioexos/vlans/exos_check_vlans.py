@@ -39,6 +39,7 @@ from netcad.feats.vlans.checks.check_vlans import (
 # -----------------------------------------------------------------------------
 
 from ..exos_dut import EXOSDeviceUnderTest
+from ..exos_tracing import trace_checks
 
 
 # -----------------------------------------------------------------------------
@@ -47,6 +48,7 @@ from ..exos_dut import EXOSDeviceUnderTest
 
 
 @EXOSDeviceUnderTest.execute_checks.register  # noqa
+@trace_checks
 async def eos_check_vlans(
     self, vlan_checks: VlanCheckCollection
 ) -> CheckResultsCollection:
@@ -66,7 +68,7 @@ async def eos_check_vlans(
     # read the active vlan information and produce a map by VLAN-ID
     # -------------------------------------------------------------------------
 
-    cli_vlan_resp = await dut.exos_jrpc.cli("show vlan")
+    cli_vlan_resp = await dut.get_vlans()
     vlan_data_map = dict()
     for rec in cli_vlan_resp:
         vlan_info = rec["vlanProc"]
@@ -83,7 +85,7 @@ async def eos_check_vlans(
     # of how EXOS reports the VLAN membership.
     # -------------------------------------------------------------------------
 
-    cli_port_sharing_resp = await dut.exos_jrpc.cli("show port sharing")
+    cli_port_sharing_resp = await dut.get_port_sharing()
     ls_port_map = defaultdict(set)
     for rec in cli_port_sharing_resp:
         if not (port_info := rec.get("ls_ports_show")):
@@ -100,6 +102,13 @@ async def eos_check_vlans(
 
     expd_vlan_ids = set()
 
+    # -------------------------------------------------------------------------
+    # retrieve the VLAN port membership for all VLANs in one bulk step.  The
+    # VLAN checks are then evaluated from this index.
+    # -------------------------------------------------------------------------
+
+    vlan_members = await dut.get_vlan_members()
+
     for check in vlan_checks.checks:
         result = VlanCheckResult(device=device, check=check)
 
@@ -115,10 +124,11 @@ async def eos_check_vlans(
             results.append(result.measure())
             continue
 
-        await _check_one_vlan(
+        _check_one_vlan(
             dut,
             exclusive=vlan_checks.exclusive,
             vlan_status=vlan_status,
+            vlan_ports=vlan_members.get(vlan_status["name"], []),
             ls_port_map=ls_port_map,
             result=result,
             results=results,
@@ -162,27 +172,26 @@ def _check_exclusive(
     results.append(result.measure())
 
 
-async def _check_one_vlan(
+def _check_one_vlan(
     dut: EXOSDeviceUnderTest,
     exclusive: bool,
     result: VlanCheckResult,
     vlan_status: dict,
+    vlan_ports: list[dict],
     ls_port_map: dict[str, set],
     results: CheckResultsCollection,
 ):
     """
     Checks a specific VLAN to ensure that it exists on the device as expected.
+    The `vlan_ports` are the VLAN member records from the DUT VLAN membership
+    index.
     """
 
     check = result.check
     msrd = result.measurement
 
-    vlan_details = await dut.exos_jrpc.cli(f"show vlan {vlan_status['name']}")
     ports = list()
-    for rec in vlan_details:
-        if not (vlan_rec := rec.get("vlanProc")):
-            continue
-
+    for vlan_rec in vlan_ports:
         if (port := str(vlan_rec["port"])).startswith("invalid"):
             continue
 
@@ -195,17 +204,14 @@ async def _check_one_vlan(
     msrd_ifs_set = set(msrd.interfaces)
     expd_ifs_set = set(check.expected_results.interfaces)
 
+    if_roles = dut.if_roles
+
     # -------------------------------------------------------------------------
     # if an expected interface is an SVI, then discard that since EXOS does
     # not report the SVI in the VLAN membership.
     # -------------------------------------------------------------------------
 
-    if virt_if_names := [
-        if_name
-        for if_name, if_info in dut.device_info["interfaces"].items()
-        if if_info["profile_flags"].get("is_virtual", False)
-    ]:
-        expd_ifs_set -= set(virt_if_names)
+    expd_ifs_set -= if_roles.virtual
 
     # -------------------------------------------------------------------------
     # if an expected interface is a lag, then we need to find the lag members
@@ -213,23 +219,11 @@ async def _check_one_vlan(
     # measured interfaces.
     # -------------------------------------------------------------------------
 
-    if lag_if_names := [
-        if_name
-        for if_name, if_info in dut.device_info["interfaces"].items()
-        if if_info["profile_flags"].get("is_lag", False)
-    ]:
+    if if_roles.lags:
         # remove the lag interface names from the set of expected interfaces
-        expd_ifs_set -= set(lag_if_names)
-
-        for lag_member_name in chain(
-            [
-                lag_intf.name
-                for lag_if_name in lag_if_names
-                for lag_intf in dut.device.interfaces[
-                    lag_if_name
-                ].profile.if_lag_members
-            ]
-        ):
+        expd_ifs_set -= if_roles.lags
+
+        for lag_member_name in chain.from_iterable(if_roles.lag_members.values()):
             if lag_member_name in ls_port_map:
                 expd_ifs_set -= ls_port_map[lag_member_name]
                 expd_ifs_set.add(lag_member_name)